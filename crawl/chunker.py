@@ -1,8 +1,11 @@
 """Semantic chunking for RAG preparation."""
-import hashlib
-import re
-from typing import List, Optional
+import functools
+import itertools
+import os
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
 import tiktoken
+import xxhash
 from models import Chunk
 from config import config
 from logger import setup_logger
@@ -10,12 +13,26 @@ from logger import setup_logger
 
 logger = setup_logger("chunker")
 
+# Worker threads for batched tokenization
+_ENCODE_THREADS = os.cpu_count() or 1
+
+# Recently split documents, keyed by (text hash, text length), so
+# re-chunking unchanged text skips the heading scan
+_SECTIONS_CACHE: "OrderedDict[Tuple[int, int], List[tuple]]" = OrderedDict()
+_SECTIONS_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(name: str = "cl100k_base") -> tiktoken.Encoding:
+    """Load a tiktoken encoding once and share it across chunkers."""
+    return tiktoken.get_encoding(name)
+
 
 class SemanticChunker:
     """Semantic chunking with heading awareness for RAG."""
     
     def __init__(self):
-        self.encoding = tiktoken.get_encoding("cl100k_base")  # GPT-4 encoding
+        self.encoding = _get_encoding("cl100k_base")  # GPT-4 encoding
         self.chunk_size = config.chunk_size_tokens
         self.overlap_tokens = int(self.chunk_size * config.chunk_overlap_percent / 100)
         
@@ -42,16 +59,52 @@ class SemanticChunker:
         Returns:
             List of chunks
         """
+        chunks = list(self.chunk_iter(
+            text,
+            doc_id,
+            source_url,
+            content_type,
+            section_path,
+            metadata
+        ))
+        
+        logger.info(f"Created {len(chunks)} chunks from document {doc_id}")
+        return chunks
+        
+    def chunk_iter(
+        self,
+        text: str,
+        doc_id: str,
+        source_url: str,
+        content_type: str,
+        section_path: List[str],
+        metadata: dict
+    ) -> Iterator[Chunk]:
+        """
+        Lazily yield deduplicated chunks in document order.
+        
+        Same arguments as chunk(); chunks are produced section by section so
+        callers can stream them without holding the whole list.
+        """
         # First, split by headings
-        sections = self._split_by_headings(text)
+        sections = self._split_by_headings_cached(text)
         
-        # Then chunk each section
-        chunks = []
+        # Tokenize all sections in one batched call; tiktoken spreads the
+        # batch over a thread pool with the GIL released
+        token_lists = self.encoding.encode_ordinary_batch(
+            [content for _, content in sections],
+            num_threads=_ENCODE_THREADS
+        )
+        
+        # Then chunk each section, dropping near-duplicates as they appear
+        seen_hashes = set()
+        duplicates_removed = 0
         position = 0
         
-        for heading, content in sections:
-            section_chunks = self._chunk_section(
+        for (heading, content), tokens in zip(sections, token_lists):
+            for chunk in self._chunk_section(
                 content,
+                tokens,
                 heading,
                 doc_id,
                 source_url,
@@ -59,15 +112,35 @@ class SemanticChunker:
                 section_path,
                 metadata,
                 position
-            )
-            chunks.extend(section_chunks)
-            position += len(section_chunks)
+            ):
+                position = chunk.position + 1
+                
+                # Content hash was computed when the chunk was created
+                if chunk.content_fingerprint in seen_hashes:
+                    logger.debug("Filtered duplicate chunk: %s", chunk.chunk_id)
+                    duplicates_removed += 1
+                    continue
+                    
+                seen_hashes.add(chunk.content_fingerprint)
+                yield chunk
+                
+        if duplicates_removed > 0:
+            logger.info(f"Removed {duplicates_removed} duplicate chunks")
             
-        # Deduplicate chunks
-        chunks = self._deduplicate_chunks(chunks)
+    def _split_by_headings_cached(self, text: str) -> List[tuple]:
+        """Split text by headings, reusing the result for recently seen text."""
+        key = (xxhash.xxh3_64_intdigest(text.encode("utf-8", "surrogatepass")), len(text))
         
-        logger.info(f"Created {len(chunks)} chunks from document {doc_id}")
-        return chunks
+        sections = _SECTIONS_CACHE.get(key)
+        if sections is not None:
+            _SECTIONS_CACHE.move_to_end(key)
+            return sections
+            
+        sections = self._split_by_headings(text)
+        _SECTIONS_CACHE[key] = sections
+        if len(_SECTIONS_CACHE) > _SECTIONS_CACHE_SIZE:
+            _SECTIONS_CACHE.popitem(last=False)
+        return sections
         
     def _split_by_headings(self, text: str) -> List[tuple]:
         """
@@ -77,32 +150,51 @@ class SemanticChunker:
             List of (heading, content) tuples
         """
         sections = []
-        lines = text.split("\n")
+        text_len = len(text)
         
         current_heading = None
-        current_content = []
+        # Offset of the first line after the current heading; past the end
+        # of text when the heading is the last line
+        content_start = 0
         
-        for line in lines:
-            # Detect markdown headings
-            if re.match(r'^#{1,6}\s+', line):
+        # Only lines starting with '#' can be headings, so jump straight
+        # from one candidate line to the next
+        if text.startswith("#"):
+            line_start = 0
+        else:
+            next_hash = text.find("\n#")
+            line_start = next_hash + 1 if next_hash >= 0 else -1
+            
+        while line_start >= 0:
+            line_end = text.find("\n", line_start)
+            if line_end < 0:
+                line_end = text_len
+            line = text[line_start:line_end]
+            
+            # Detect markdown headings: 1-6 '#' followed by whitespace
+            level = len(line) - len(line.lstrip("#"))
+            if level <= 6 and level < len(line) and line[level].isspace():
                 # Save previous section
-                if current_heading or current_content:
+                has_content = line_start > content_start
+                if current_heading or has_content:
                     sections.append((
                         current_heading,
-                        "\n".join(current_content)
+                        text[content_start:line_start - 1] if has_content else ""
                     ))
                     
                 # Start new section
-                current_heading = line.lstrip("#").strip()
-                current_content = []
-            else:
-                current_content.append(line)
+                current_heading = line[level:].strip()
+                content_start = line_end + 1
                 
+            next_hash = text.find("\n#", line_end)
+            line_start = next_hash + 1 if next_hash >= 0 else -1
+            
         # Save last section
-        if current_heading or current_content:
+        has_content = content_start <= text_len
+        if current_heading or has_content:
             sections.append((
                 current_heading,
-                "\n".join(current_content)
+                text[content_start:] if has_content else ""
             ))
             
         return sections
@@ -110,6 +202,7 @@ class SemanticChunker:
     def _chunk_section(
         self,
         content: str,
+        tokens: List[int],
         heading: Optional[str],
         doc_id: str,
         source_url: str,
@@ -117,17 +210,18 @@ class SemanticChunker:
         section_path: List[str],
         metadata: dict,
         start_position: int
-    ) -> List[Chunk]:
-        """Chunk a single section with overlap."""
-        chunks = []
+    ) -> Iterator[Chunk]:
+        """Yield chunks for a single pre-tokenized section with overlap."""
+        # Hoist attribute lookups out of the windowing loop
+        chunk_size = self.chunk_size
+        overlap_tokens = self.overlap_tokens
+        min_chunk_size = config.min_chunk_size_tokens
+        num_tokens = len(tokens)
         
-        # Tokenize content
-        tokens = self.encoding.encode(content)
-        
-        # If section fits in one chunk, return it
-        if len(tokens) <= self.chunk_size:
-            if len(tokens) >= config.min_chunk_size_tokens:
-                chunk = self._create_chunk(
+        # If section fits in one chunk, yield it whole
+        if num_tokens <= chunk_size:
+            if num_tokens >= min_chunk_size:
+                yield self._create_chunk(
                     content,
                     heading,
                     doc_id,
@@ -137,23 +231,26 @@ class SemanticChunker:
                     metadata,
                     start_position
                 )
-                chunks.append(chunk)
-            return chunks
+            return
             
-        # Otherwise, split with overlap
+        # Otherwise, split with overlap. Token boundaries are mapped to byte
+        # offsets in the section so each window is sliced from the source
+        # text instead of decoded back from tokens. tiktoken turns a lone
+        # surrogate into U+FFFD, which is also 3 bytes, so surrogatepass keeps
+        # the offsets aligned where a strict encode would raise.
+        content_bytes = content.encode("utf-8", "surrogatepass")
+        byte_offsets = list(itertools.accumulate(
+            map(len, self.encoding.decode_tokens_bytes(tokens)), initial=0
+        ))
         start = 0
         position = start_position
         
-        while start < len(tokens):
-            end = min(start + self.chunk_size, len(tokens))
-            chunk_tokens = tokens[start:end]
-            
-            # Decode tokens back to text
-            chunk_text = self.encoding.decode(chunk_tokens)
+        while start < num_tokens:
+            end = min(start + chunk_size, num_tokens)
             
-            # Create chunk
-            if len(chunk_tokens) >= config.min_chunk_size_tokens:
-                chunk = self._create_chunk(
+            if end - start >= min_chunk_size:
+                chunk_text = content_bytes[byte_offsets[start]:byte_offsets[end]].decode("utf-8", "replace")
+                yield self._create_chunk(
                     chunk_text,
                     heading,
                     doc_id,
@@ -163,17 +260,18 @@ class SemanticChunker:
                     metadata,
                     position
                 )
-                chunks.append(chunk)
                 position += 1
                 
+            # Last window reached the end of the section
+            if end == num_tokens:
+                break
+                
             # Move start with overlap
-            start = end - self.overlap_tokens
+            start = end - overlap_tokens
             
             # Prevent infinite loop
             if start >= end:
                 break
-                
-        return chunks
         
     def _create_chunk(
         self,
@@ -187,18 +285,24 @@ class SemanticChunker:
         position: int
     ) -> Chunk:
         """Create a chunk object."""
+        text = text.strip()
+        
+        # Fingerprint the content once (first 200 chars for similarity);
+        # it doubles as the dedup key and the unique part of the chunk ID
+        prefix = text if len(text) <= 200 else text[:200]
+        fingerprint = xxhash.xxh3_64_intdigest(prefix.encode("utf-8", "ignore"))
+        
         # Generate chunk ID
-        chunk_id = hashlib.sha256(
-            f"{doc_id}_{position}_{text[:100]}".encode()
-        ).hexdigest()
+        chunk_id = f"{doc_id}-{position}-{fingerprint:016x}"
         
-        return Chunk(
+        # Every field is built here with the right type, so skip validation
+        return Chunk.model_construct(
             chunk_id=chunk_id,
             doc_id=doc_id,
             source_url=source_url,
             content_type=content_type,
             section_path=section_path,
-            text=text.strip(),
+            text=text,
             anchor_heading=heading,
             position=position,
             event_date=metadata.get("event_date"),
@@ -207,26 +311,6 @@ class SemanticChunker:
             date_range_end=metadata.get("date_range_end"),
             entity_type=metadata.get("entity_type"),
             working_group=metadata.get("working_group"),
-            metadata=metadata
+            metadata=metadata,
+            content_fingerprint=fingerprint
         )
-        
-    def _deduplicate_chunks(self, chunks: List[Chunk]) -> List[Chunk]:
-        """Remove near-duplicate chunks based on content hash."""
-        seen_hashes = set()
-        unique_chunks = []
-        
-        for chunk in chunks:
-            # Create content hash (first 200 chars for similarity)
-            content_hash = hashlib.md5(chunk.text[:200].encode()).hexdigest()
-            
-            if content_hash not in seen_hashes:
-                seen_hashes.add(content_hash)
-                unique_chunks.append(chunk)
-            else:
-                logger.debug(f"Filtered duplicate chunk: {chunk.chunk_id}")
-                
-        duplicates_removed = len(chunks) - len(unique_chunks)
-        if duplicates_removed > 0:
-            logger.info(f"Removed {duplicates_removed} duplicate chunks")
-            
-        return unique_chunks
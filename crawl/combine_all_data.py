@@ -1,7 +1,11 @@
 """Combine all crawled JSON files into a single master dataset."""
-import json
 import io
+import os
+import orjson
+import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -10,82 +14,112 @@ if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Skip logs, metrics, frontier files, and previous exports
+_SKIP_RE = re.compile(r'metrics|frontier|complete_data|scraped_data', re.IGNORECASE)
+
+
+def _load_documents(json_file: Path) -> list:
+    """Load one crawled JSON file and return the documents it contains."""
+    # Only include section_slug_timestamp.json pattern usually
+    # But we'll try to read everything that looks like a document export
+    try:
+        with open(json_file, 'rb', buffering=1 << 16) as f:
+            data = orjson.loads(f.read())
+            
+        # Normalize different formats we used
+        docs_to_add = []
+        
+        if "documents" in data:
+            docs = data["documents"]
+            if isinstance(docs, list):
+                docs_to_add = docs
+            else:
+                docs_to_add = [docs]
+        elif isinstance(data, dict) and "url" in data and "raw_text" in data:
+             # Single doc structure
+             docs_to_add = [data]
+             
+        for doc in docs_to_add:
+            # Add source filename for traceability
+            doc["_source_file"] = json_file.name
+            
+        return docs_to_add
+        
+    except Exception as e:
+        # print(f"Skipping {json_file.name}: {e}")
+        return []
+
+
+def _iter_loaded(json_files, max_workers: int):
+    """
+    Load files on a thread pool, yielding (file, documents) in input order.
+    
+    At most 2 * max_workers files are in flight, so memory stays bounded
+    while the output is streamed.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for json_file in json_files:
+            pending.append((json_file, executor.submit(_load_documents, json_file)))
+            if len(pending) >= 2 * max_workers:
+                done_file, future = pending.popleft()
+                yield done_file, future.result()
+        while pending:
+            done_file, future = pending.popleft()
+            yield done_file, future.result()
+
+
 def combine_data(output_dir: Path = Path("output"), output_file: str = "indiaai_impact_complete_data.json"):
     """Combine all crawled data into one file."""
     print(f"Scanning {output_dir} for data files...")
     
-    master_data = {
-        "metadata": {
-            "title": "IndiaAI Impact Summit Website Dump",
-            "generated_at": datetime.now().isoformat(),
-            "source_domain": "impact.indiaai.gov.in",
-        },
-        "stats": {
-            "total_pages": 0,
-            "sections_covered": [],
-        },
-        "documents": []
+    metadata = {
+        "title": "IndiaAI Impact Summit Website Dump",
+        "generated_at": datetime.now().isoformat(),
+        "source_domain": "impact.indiaai.gov.in",
     }
     
+    # Walk through all directories
+    json_files = [
+        json_file for json_file in output_dir.rglob("*.json")
+        if not _SKIP_RE.search(json_file.name)
+    ]
+    
+    total_pages = 0
     sections_found = set()
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
     
-    # Walk through all directories
-    for json_file in output_dir.rglob("*.json"):
-        # Skip logs, metrics, frontier files, and previous exports
-        if any(x in json_file.name.lower() for x in ["metrics", "frontier", "complete_data", "scraped_data"]):
-            continue
-            
-        # Only include section_slug_timestamp.json pattern usually
-        # But we'll try to read everything that looks like a document export
+    # Documents are streamed to the output file as they are read, so only
+    # a bounded number of input files is held in memory at a time. Stats
+    # are written last.
+    with open(output_file, 'wb', buffering=1 << 16) as out:
+        out.write(b'{"metadata": ' + orjson.dumps(metadata) + b',\n"documents": [\n')
         
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            # Normalize different formats we used
-            docs_to_add = []
-            
-            if "documents" in data:
-                docs = data["documents"]
-                if isinstance(docs, list):
-                    docs_to_add = docs
-                else:
-                    docs_to_add = [docs]
-            elif isinstance(data, dict) and "url" in data and "raw_text" in data:
-                 # Single doc structure
-                 docs_to_add = [data]
-            
+        for json_file, docs_to_add in _iter_loaded(json_files, max_workers):
             # Add valid documents
             for doc in docs_to_add:
-                # Add source filename for traceability
-                doc["_source_file"] = json_file.name
-                
                 # Deduplicate based on URL if possible (optional)
-                master_data["documents"].append(doc)
+                if total_pages:
+                    out.write(b",\n")
+                out.write(orjson.dumps(doc, option=orjson.OPT_INDENT_2))
+                total_pages += 1
                 
+            if docs_to_add:
                 # Track sections
-                section = json_file.parent.name
-                sections_found.add(section)
-                
+                sections_found.add(json_file.parent.name)
                 print(f"✓ Added: {json_file.name} ({len(docs_to_add)} docs)")
                 
-        except Exception as e:
-            # print(f"Skipping {json_file.name}: {e}")
-            pass
-            
-    # Update stats
-    master_data["stats"]["total_pages"] = len(master_data["documents"])
-    master_data["stats"]["sections_covered"] = sorted(list(sections_found))
-    
-    # Save master file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(master_data, f, indent=2, ensure_ascii=False)
+        stats = {
+            "total_pages": total_pages,
+            "sections_covered": sorted(sections_found),
+        }
+        out.write(b'\n],\n"stats": ' + orjson.dumps(stats) + b'}\n')
         
     print(f"\n" + "="*50)
-    print(f"COMPLETED! Combined {master_data['stats']['total_pages']} pages.")
-    print(f"Sections covered: {', '.join(master_data['stats']['sections_covered'])}")
+    print(f"COMPLETED! Combined {stats['total_pages']} pages.")
+    print(f"Sections covered: {', '.join(stats['sections_covered'])}")
     print(f"Saved to: {output_file}")
     print(f"="*50)
 
 if __name__ == "__main__":
-    Combine_data() if "combine" in sys.argv else combine_data()
+    combine_data()
@@ -1,62 +1,109 @@
 """Configuration management for IndiaAI crawler."""
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+from dataclasses import dataclass, field, fields
+from dotenv import dotenv_values
 from pathlib import Path
 from typing import Optional
 
 
-class CrawlerConfig(BaseSettings):
+_TRUE_VALUES = {"1", "true", "t", "yes", "y", "on"}
+_FALSE_VALUES = {"0", "false", "f", "no", "n", "off"}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value."""
+    lowered = value.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+# Converters from raw environment strings to field types
+_CONVERTERS = {
+    int: int,
+    float: float,
+    bool: _parse_bool,
+    str: str,
+    Path: Path,
+    Optional[str]: str,
+}
+
+
+@dataclass(slots=True)
+class CrawlerConfig:
     """Main crawler configuration."""
     
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
-    
     # Concurrency settings
-    max_concurrent_requests: int = Field(default=5, description="Max concurrent crawl requests")
-    max_depth: int = Field(default=5, description="Maximum crawl depth")
-    max_pages_per_run: int = Field(default=1000, description="Max pages to crawl per run")
-    max_pages_per_section: int = Field(default=150, description="Max pages per section")
-    request_delay_seconds: float = Field(default=2.0, description="Delay between request batches")
+    max_concurrent_requests: int = field(default=5, metadata={"description": "Max concurrent crawl requests"})
+    max_depth: int = field(default=5, metadata={"description": "Maximum crawl depth"})
+    max_pages_per_run: int = field(default=1000, metadata={"description": "Max pages to crawl per run"})
+    max_pages_per_section: int = field(default=150, metadata={"description": "Max pages per section"})
+    max_requests_per_host: int = field(default=5, metadata={"description": "Max concurrent requests to one host"})
+    request_delay_seconds: float = field(default=2.0, metadata={"description": "Min delay between requests to one host"})
     
     # Timeout settings
-    page_timeout_ms: int = Field(default=60000, description="Page load timeout in milliseconds")
-    wait_for_selector_timeout_ms: int = Field(default=10000, description="Selector wait timeout")
+    page_timeout_ms: int = field(default=60000, metadata={"description": "Page load timeout in milliseconds"})
+    wait_for_selector_timeout_ms: int = field(default=10000, metadata={"description": "Selector wait timeout"})
     
     # User agent
-    user_agent: str = Field(
+    user_agent: str = field(
         default="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        description="Browser user agent"
+        metadata={"description": "Browser user agent"}
     )
     
     # Domain scope
-    allowed_domain: str = Field(default="impact.indiaai.gov.in", description="Allowed crawl domain")
+    allowed_domain: str = field(default="impact.indiaai.gov.in", metadata={"description": "Allowed crawl domain"})
     
     # Anti-bot settings
-    enable_stealth: bool = Field(default=True, description="Enable stealth mode")
-    enable_undetected: bool = Field(default=True, description="Enable undetected browser mode")
-    proxy_url: Optional[str] = Field(default=None, description="Proxy URL (optional)")
+    enable_stealth: bool = field(default=True, metadata={"description": "Enable stealth mode"})
+    enable_undetected: bool = field(default=True, metadata={"description": "Enable undetected browser mode"})
+    proxy_url: Optional[str] = field(default=None, metadata={"description": "Proxy URL (optional)"})
     
     # Output settings
-    output_dir: Path = Field(default=Path("./output"), description="Output directory")
-    log_level: str = Field(default="INFO", description="Logging level")
+    output_dir: Path = field(default=Path("./output"), metadata={"description": "Output directory"})
+    log_level: str = field(default="INFO", metadata={"description": "Logging level"})
     
     # Chunking settings
-    chunk_size_tokens: int = Field(default=800, description="Target chunk size in tokens")
-    chunk_overlap_percent: int = Field(default=12, description="Chunk overlap percentage")
-    min_chunk_size_tokens: int = Field(default=100, description="Minimum chunk size")
+    chunk_size_tokens: int = field(default=800, metadata={"description": "Target chunk size in tokens"})
+    chunk_overlap_percent: int = field(default=12, metadata={"description": "Chunk overlap percentage"})
+    min_chunk_size_tokens: int = field(default=100, metadata={"description": "Minimum chunk size"})
     
     # Retry settings
-    max_retries: int = Field(default=3, description="Max retry attempts per URL")
-    retry_backoff_factor: float = Field(default=2.0, description="Exponential backoff factor")
+    max_retries: int = field(default=3, metadata={"description": "Max retry attempts per URL"})
+    retry_backoff_factor: float = field(default=2.0, metadata={"description": "Exponential backoff factor"})
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Ensure output directories exist
+    def ensure_dirs(self):
+        """Create the output directory tree; call before writing crawl output."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
         (self.output_dir / "documents").mkdir(exist_ok=True)
         (self.output_dir / "chunks").mkdir(exist_ok=True)
         (self.output_dir / "pdfs").mkdir(exist_ok=True)
         (self.output_dir / "logs").mkdir(exist_ok=True)
+    
+    @classmethod
+    def _load_env(cls, env_file: str = ".env", **overrides) -> "CrawlerConfig":
+        """
+        Build config from environment variables and an optional .env file.
+        
+        Variable names match field names case-insensitively. Precedence:
+        overrides > environment > .env file > defaults.
+        """
+        env = {
+            key.lower(): value
+            for key, value in dotenv_values(env_file, encoding="utf-8").items()
+            if value is not None
+        }
+        env.update((key.lower(), value) for key, value in os.environ.items())
+        
+        values = {}
+        for f in fields(cls):
+            if f.name in env:
+                values[f.name] = _CONVERTERS[f.type](env[f.name])
+        values.update(overrides)
+        return cls(**values)
 
 
 # Global config instance
-config = CrawlerConfig()
+config = CrawlerConfig._load_env()
@@ -47,16 +47,17 @@ def main():
     
     # List sections if requested
     if args.list_sections:
-        print("\n" + "="*60)
-        print("AVAILABLE SECTIONS")
-        print("="*60)
+        lines = ["\n" + "="*60, "AVAILABLE SECTIONS", "="*60]
         for section_id, section_info in get_all_sections():
-            print(f"\n{section_info['priority']}. {section_id}")
-            print(f"   Name: {section_info['name']}")
-            print(f"   Description: {section_info['description']}")
-            print(f"   Seeds: {len(section_info['seeds'])} URLs")
-            print(f"   Max Pages: {section_info['max_pages']}")
-        print("="*60)
+            lines += [
+                f"\n{section_info['priority']}. {section_id}",
+                f"   Name: {section_info['name']}",
+                f"   Description: {section_info['description']}",
+                f"   Seeds: {len(section_info['seeds'])} URLs",
+                f"   Max Pages: {section_info['max_pages']}",
+            ]
+        lines.append("="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
     # Get section configuration
@@ -66,24 +67,22 @@ def main():
         print("Use --list-sections to see available sections")
         return
     
-    print("\n" + "="*60)
-    print(f"CRAWLING SECTION: {section['name']}")
-    print("="*60)
-    print(f"Description: {section['description']}")
-    print(f"Seeds: {len(section['seeds'])} URLs")
-    print(f"Max Pages: {section['max_pages']}")
-    print("="*60 + "\n")
+    sys.stdout.write(
+        "\n" + "="*60 + "\n"
+        f"CRAWLING SECTION: {section['name']}\n"
+        + "="*60 + "\n"
+        f"Description: {section['description']}\n"
+        f"Seeds: {len(section['seeds'])} URLs\n"
+        f"Max Pages: {section['max_pages']}\n"
+        + "="*60 + "\n\n"
+    )
     
     # Setup output directory for this section
     section_output_dir = args.output_dir / args.section
-    section_output_dir.mkdir(parents=True, exist_ok=True)
-    (section_output_dir / "documents").mkdir(exist_ok=True)
-    (section_output_dir / "chunks").mkdir(exist_ok=True)
-    (section_output_dir / "pdfs").mkdir(exist_ok=True)
-    (section_output_dir / "logs").mkdir(exist_ok=True)
     
     # Update config
     config.output_dir = section_output_dir
+    config.ensure_dirs()
     
     # Initialize frontier with section-specific database
     frontier_db = Path(f"frontier_{args.section}.db")
@@ -91,31 +90,30 @@ def main():
         frontier_db.unlink()
         logger.info(f"Cleared section frontier database: {frontier_db}")
     
-    frontier = URLFrontier(frontier_db)
-    
-    # Enqueue section seeds
-    for seed in section['seeds']:
-        frontier.enqueue(seed, depth=0)
-        logger.info(f"Enqueued: {seed}")
-    
-    # Show frontier stats
-    stats = frontier.get_stats()
-    logger.info(f"Frontier stats: {stats}")
-    
-    # Create section filter function
-    from sections import url_matches_section
-    section_filter = lambda url: url_matches_section(url, args.section)
-    
-    # Create crawler with section filter
-    crawler = IndiaAICrawler(frontier, section_filter=section_filter)
-    
-    # Run crawl
-    logger.info(f"Starting section crawl with max_pages={section['max_pages']}")
-    asyncio.run(crawler.crawl(max_pages=section['max_pages']))
-    
-    # Show final stats
-    final_stats = frontier.get_stats()
-    logger.info(f"Final frontier stats: {final_stats}")
+    with URLFrontier(frontier_db) as frontier:
+        # Enqueue section seeds
+        for seed in section['seeds']:
+            frontier.enqueue(seed, depth=0)
+            logger.info(f"Enqueued: {seed}")
+        
+        # Show frontier stats
+        stats = frontier.get_stats()
+        logger.info(f"Frontier stats: {stats}")
+        
+        # Create section filter function
+        from sections import url_matches_section
+        section_filter = lambda url: url_matches_section(url, args.section)
+        
+        # Create crawler with section filter
+        crawler = IndiaAICrawler(frontier, section_filter=section_filter)
+        
+        # Run crawl
+        logger.info(f"Starting section crawl with max_pages={section['max_pages']}")
+        asyncio.run(crawler.crawl(max_pages=section['max_pages']))
+        
+        # Show final stats
+        final_stats = frontier.get_stats()
+        logger.info(f"Final frontier stats: {final_stats}")
     
     metrics_summary = metrics.get_summary()
     logger.info(f"Crawl metrics: {metrics_summary}")
@@ -125,21 +123,23 @@ def main():
     export_filename = f"{args.section}_data_{timestamp}.json"
     export_path = export_all_data(section_output_dir, export_filename)
     
-    print("\n" + "="*60)
-    print(f"SECTION CRAWL COMPLETE: {section['name']}")
-    print("="*60)
-    print(f"Pages attempted: {metrics_summary['pages_attempted']}")
-    print(f"Pages succeeded: {metrics_summary['pages_succeeded']}")
-    print(f"Pages failed: {metrics_summary['pages_failed']}")
-    print(f"Entities extracted: {metrics_summary['entities_extracted']}")
-    print(f"Chunks created: {metrics_summary['chunks_created']}")
-    print(f"PDFs processed: {metrics_summary['pdfs_processed']}")
-    print(f"\nSection output: {section_output_dir.absolute()}")
-    print(f"Consolidated JSON: {export_path.absolute()}")
-    print("="*60)
-    print(f"\n✓ Section '{args.section}' complete!")
-    print(f"✓ Save this file locally: {export_path.name}")
-    print("="*60 + "\n")
+    sys.stdout.write(
+        "\n" + "="*60 + "\n"
+        f"SECTION CRAWL COMPLETE: {section['name']}\n"
+        + "="*60 + "\n"
+        f"Pages attempted: {metrics_summary['pages_attempted']}\n"
+        f"Pages succeeded: {metrics_summary['pages_succeeded']}\n"
+        f"Pages failed: {metrics_summary['pages_failed']}\n"
+        f"Entities extracted: {metrics_summary['entities_extracted']}\n"
+        f"Chunks created: {metrics_summary['chunks_created']}\n"
+        f"PDFs processed: {metrics_summary['pdfs_processed']}\n"
+        f"\nSection output: {section_output_dir.absolute()}\n"
+        f"Consolidated JSON: {export_path.absolute()}\n"
+        + "="*60 + "\n"
+        f"\n✓ Section '{args.section}' complete!\n"
+        f"✓ Save this file locally: {export_path.name}\n"
+        + "="*60 + "\n\n"
+    )
 
 
 if __name__ == "__main__":
@@ -24,33 +24,26 @@ logger = setup_logger("single_url_crawler")
 
 def crawl_single_url(url: str, section_name: str):
     """Crawl a single URL and export immediately."""
-    print(f"\n{'='*60}")
-    print(f"CRAWLING: {url}")
-    print(f"{'='*60}\n")
+    sys.stdout.write(f"\n{'='*60}\nCRAWLING: {url}\n{'='*60}\n\n")
     
     # Setup output directory
     section_output_dir = Path("output") / section_name
-    section_output_dir.mkdir(parents=True, exist_ok=True)
-    (section_output_dir / "documents").mkdir(exist_ok=True)
-    (section_output_dir / "chunks").mkdir(exist_ok=True)
-    (section_output_dir / "pdfs").mkdir(exist_ok=True)
-    (section_output_dir / "logs").mkdir(exist_ok=True)
-    
     config.output_dir = section_output_dir
+    config.ensure_dirs()
     
     # Initialize frontier
     frontier_db = Path(f"frontier_{section_name}_single.db")
     if frontier_db.exists():
         frontier_db.unlink()
     
-    frontier = URLFrontier(frontier_db)
-    frontier.enqueue(url, depth=0)
-    
-    # Create crawler
-    crawler = IndiaAICrawler(frontier)
-    
-    # Crawl just this one URL
-    asyncio.run(crawler.crawl(max_pages=1))
+    with URLFrontier(frontier_db) as frontier:
+        frontier.enqueue(url, depth=0)
+        
+        # Create crawler
+        crawler = IndiaAICrawler(frontier)
+        
+        # Crawl just this one URL
+        asyncio.run(crawler.crawl(max_pages=1))
     
     # Export immediately
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -58,9 +51,7 @@ def crawl_single_url(url: str, section_name: str):
     export_filename = f"{section_name}_{url_slug}_{timestamp}.json"
     export_path = export_all_data(section_output_dir, export_filename)
     
-    print(f"\n{'='*60}")
-    print(f"✓ Exported to: {export_path.name}")
-    print(f"{'='*60}\n")
+    sys.stdout.write(f"\n{'='*60}\n✓ Exported to: {export_path.name}\n{'='*60}\n\n")
     
     return export_path
 
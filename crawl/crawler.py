@@ -1,39 +1,104 @@
 """Main crawler orchestrator."""
 import asyncio
-import hashlib
-import json
+import contextlib
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
+from urllib.parse import urlsplit
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from soup_utils import make_tree, element_text
 import aiohttp
 import os
 
 from config import config
-from models import PageDocument, ContentType, OutboundLink, CrawlResult
+from models import PageDocument, ContentType, OutboundLink, LinkType, CrawlResult
 from frontier import URLFrontier
 from url_utils import (
     canonicalize_url,
     is_in_scope,
     is_pdf,
     classify_url,
-    extract_links,
+    extract_links_from_tree,
     classify_link_text,
     extract_section_path
 )
 from extractors import AgendaExtractor, EventExtractor, NewsExtractor
 from chunker import SemanticChunker
+from ids import make_id
 from logger import setup_logger, metrics
 
 
 logger = setup_logger("crawler")
 
+# Read size when streaming PDF downloads to disk
+PDF_CHUNK_SIZE = 64 * 1024
+
+# Idle seconds a pooled connection is kept for reuse; PDF fetches are
+# spread out by the crawl delay, so the 15s aiohttp default drops most
+HTTP_KEEPALIVE_SECONDS = 120
+
+
+def make_http_session() -> aiohttp.ClientSession:
+    """
+    Create the pooled HTTP session used for direct downloads.
+    
+    Must be called with an event loop running. ssl=False because of
+    potential SSL issues with govt sites.
+    """
+    connector = aiohttp.TCPConnector(
+        limit_per_host=8,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        ssl=False,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+class _HostLimiter:
+    """
+    Per-host request pacing shared by all crawl workers.
+    
+    Caps how many requests run against a host at once and spaces their
+    starts at least min_interval seconds apart, however many workers
+    there are.
+    """
+    
+    def __init__(self, max_per_host: int, min_interval: float):
+        self._max_per_host = max(1, max_per_host)
+        self._min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+        
+    @contextlib.asynccontextmanager
+    async def slot(self, url: str):
+        """Hold a request slot for the URL's host while the block runs."""
+        host = urlsplit(url).netloc
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self._max_per_host)
+            
+        async with semaphore:
+            # Reserve the next start time before sleeping, so concurrent
+            # callers queue up behind each other instead of all waking at once
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self._min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
 
 class IndiaAICrawler:
     """Main crawler orchestrator for IndiaAI Impact website."""
     
-    def __init__(self, frontier: URLFrontier, section_filter=None):
+    def __init__(
+        self,
+        frontier: URLFrontier,
+        section_filter=None,
+        http_session: Optional[aiohttp.ClientSession] = None
+    ):
         self.frontier = frontier
         self.chunker = SemanticChunker()
         self.section_filter = section_filter  # Function to filter URLs by section
@@ -46,6 +111,15 @@ class IndiaAICrawler:
             ContentType.NEWS: NewsExtractor(),
         }
         
+        # Output writer state, set up for the duration of crawl()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._jsonl_file = None
+        
+        # Shared HTTP session for PDF downloads, reused across the crawl.
+        # A session passed in belongs to the caller and is left open.
+        self._pdf_session: Optional[aiohttp.ClientSession] = http_session
+        self._owns_pdf_session = http_session is None
+        
     async def crawl(self, max_pages: Optional[int] = None):
         """
         Main crawl loop.
@@ -55,6 +129,9 @@ class IndiaAICrawler:
         """
         logger.info("Starting crawl...")
         
+        # Create output directories for documents, chunks and PDFs
+        config.ensure_dirs()
+        
         # Reset any in-progress URLs from previous crash
         self.frontier.reset_in_progress()
         
@@ -88,15 +165,24 @@ class IndiaAICrawler:
         )
         
         pages_crawled = 0
+        in_flight = 0
         max_to_crawl = max_pages or config.max_pages_per_run
+        num_workers = max(1, config.max_concurrent_requests)
+        limiter = _HostLimiter(config.max_requests_per_host, config.request_delay_seconds)
         
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            while pages_crawled < max_to_crawl:
-                # Get next URL
+        async def worker(crawler: AsyncWebCrawler):
+            nonlocal pages_crawled, in_flight
+            
+            # Frontier calls are synchronous, so each check-and-claim below
+            # runs without interleaving other workers
+            while pages_crawled + in_flight < max_to_crawl:
                 url_data = self.frontier.dequeue()
                 if not url_data:
-                    logger.info("No more URLs in frontier")
-                    break
+                    if in_flight == 0:
+                        return
+                    # Other workers may still discover links; poll again
+                    await asyncio.sleep(0.5)
+                    continue
                     
                 url, depth, url_hash = url_data
                 
@@ -106,28 +192,62 @@ class IndiaAICrawler:
                     self.frontier.mark_success(url_hash)
                     continue
                     
-                logger.info(f"Crawling [{pages_crawled + 1}/{max_to_crawl}]: {url} (depth={depth})")
+                in_flight += 1
+                logger.info(f"Crawling [{pages_crawled + in_flight}/{max_to_crawl}]: {url} (depth={depth})")
                 
                 try:
-                    # Crawl page
-                    result = await self._crawl_page(crawler, crawler_config, url, depth, url_hash)
+                    # Crawl page, paced per host across all workers
+                    async with limiter.slot(url):
+                        result = await self._crawl_page(crawler, crawler_config, url, depth, url_hash)
                     
                     # Save result
                     if result.page_document:
-                        self._save_result(result)
+                        await self._save_result(result)
                         
                     pages_crawled += 1
                     metrics.increment("pages_succeeded")
                     
-                    # Rate limiting
-                    await asyncio.sleep(config.request_delay_seconds)
-                    
                 except Exception as e:
                     logger.error(f"Error crawling {url}: {e}", exc_info=True)
                     self.frontier.mark_failure(url_hash, str(e))
                     metrics.increment("pages_failed")
                     metrics.add_error(url, str(e))
                     
+                finally:
+                    in_flight -= 1
+        
+        # Output files are written by a single background thread so disk
+        # I/O stays off the event loop and JSONL lines are never interleaved
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="writer")
+        self._jsonl_file = open(config.output_dir / "all_data.jsonl", "ab")
+        
+        try:
+            async with AsyncWebCrawler(config=browser_config) as crawler:
+                # Workers share one browser and pull from the frontier until it
+                # drains or the page budget is reached. If one worker fails,
+                # the rest are cancelled rather than left running.
+                tasks = [asyncio.create_task(worker(crawler)) for _ in range(num_workers)]
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+                
+                if pages_crawled < max_to_crawl:
+                    logger.info("No more URLs in frontier")
+        finally:
+            if self._owns_pdf_session and self._pdf_session is not None:
+                await self._pdf_session.close()
+                self._pdf_session = None
+                
+            # Flush pending writes before exporting
+            self._writer.shutdown(wait=True)
+            self._jsonl_file.close()
+            self._writer = None
+            self._jsonl_file = None
+                    
         logger.info(f"Crawl complete. Pages crawled: {pages_crawled}")
         metrics.save()
         
@@ -166,13 +286,14 @@ class IndiaAICrawler:
         else:
             markdown = str(result.markdown)
             
-        # Fallback text extraction if markdown is empty
+        # Links, title and fallback text come from a bare lxml tree;
+        # extractors parse their own soup when they run
+        tree = make_tree(html)
+        
+        # Fallback text extraction if markdown is empty (script and style
+        # contents are skipped)
         if not markdown.strip():
-            soup = BeautifulSoup(html, "html.parser")
-            # Remove scripts and styles
-            for script in soup(["script", "style"]):
-                script.decompose()
-            markdown = soup.get_text(separator="\n\n", strip=True)
+            markdown = element_text(tree, separator="\n\n")
             logger.info(f"Used fallback text extraction for {url}")
         
         # Classify content type
@@ -185,22 +306,23 @@ class IndiaAICrawler:
             entities = extractor.extract(html, markdown, url)
             metrics.increment("entities_extracted", len(entities))
             
-        # Extract outbound links
-        outbound_links = self._extract_outbound_links(html, url)
+        # Extract links once for both outbound metadata and discovery
+        links = extract_links_from_tree(tree, url)
         
-        # Discover and enqueue new URLs
-        discovered = self._discover_links(html, url, depth)
+        # Build outbound links and enqueue new URLs
+        outbound_links, discovered = self._process_links(links, url, depth)
         logger.info(f"Discovered {discovered} new URLs from {url}")
         
         # Create page document
-        doc_id = hashlib.sha256(canonicalize_url(url).encode()).hexdigest()
+        canonical_url = canonicalize_url(url)
+        doc_id = make_id(canonical_url)
         
         page_doc = PageDocument(
             doc_id=doc_id,
             source_url=url,
-            canonical_url=canonicalize_url(url),
+            canonical_url=canonical_url,
             content_type=content_type,
-            title=self._extract_title(html),
+            title=self._extract_title(tree),
             section_path=extract_section_path(url),
             crawl_timestamp_utc=datetime.utcnow().isoformat() + "Z",
             raw_text=markdown,
@@ -236,47 +358,60 @@ class IndiaAICrawler:
             chunks=chunks
         )
         
+    def _get_pdf_session(self) -> aiohttp.ClientSession:
+        """Return the shared PDF session, creating it on first use."""
+        if self._pdf_session is None or self._pdf_session.closed:
+            # Pooled connections avoid a new TLS handshake per PDF
+            self._pdf_session = make_http_session()
+            self._owns_pdf_session = True
+        return self._pdf_session
+        
     async def _crawl_pdf(self, url: str, url_hash: str) -> CrawlResult:
         """Handle PDF crawling and downloading."""
         logger.info(f"PDF detected: {url}")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, ssl=False) as response:
-                    if response.status == 200:
-                        content = await response.read()
+            session = self._get_pdf_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    # Generate filename from URL
+                    filename = url.split("/")[-1]
+                    if not filename.endswith(".pdf"):
+                        filename += ".pdf"
                         
-                        # Generate filename from URL
-                        filename = url.split("/")[-1]
-                        if not filename.endswith(".pdf"):
-                            filename += ".pdf"
-                            
-                        # Save PDF
-                        pdf_path = config.output_dir / "pdfs" / filename
-                        with open(pdf_path, "wb") as f:
-                            f.write(content)
-                            
-                        # Save metadata
-                        meta = {
-                            "url": url,
-                            "filename": filename,
-                            "size_bytes": len(content),
-                            "downloaded_at": datetime.utcnow().isoformat() + "Z"
-                        }
+                    # Stream PDF to disk so memory use doesn't grow with file size
+                    pdf_path = config.output_dir / "pdfs" / filename
+                    # File calls run on the writer thread, in order, so a slow
+                    # disk doesn't stall the other workers
+                    size_bytes = 0
+                    f = await self._on_writer(open, pdf_path, "wb")
+                    try:
+                        async for chunk in response.content.iter_chunked(PDF_CHUNK_SIZE):
+                            await self._on_writer(f.write, chunk)
+                            size_bytes += len(chunk)
+                    finally:
+                        await self._on_writer(f.close)
                         
-                        meta_path = config.output_dir / "pdfs" / f"{filename}.json"
-                        with open(meta_path, "w", encoding="utf-8") as f:
-                            json.dump(meta, f, indent=2)
-                            
-                        metrics.increment("pdfs_processed")
-                        logger.info(f"Downloaded PDF: {filename}")
+                    # Save metadata
+                    meta = {
+                        "url": url,
+                        "filename": filename,
+                        "size_bytes": size_bytes,
+                        "downloaded_at": datetime.utcnow().isoformat() + "Z"
+                    }
+                    
+                    meta_path = config.output_dir / "pdfs" / f"{filename}.json"
+                    await self._on_writer(meta_path.write_bytes, orjson.dumps(meta, option=orjson.OPT_INDENT_2))
                         
-                        self.frontier.mark_success(url_hash)
-                        return CrawlResult(
-                            url=url,
-                            success=True,
-                            crawl_timestamp=datetime.utcnow().isoformat() + "Z",
-                        )
+                    metrics.increment("pdfs_processed")
+                    logger.info(f"Downloaded PDF: {filename}")
+                    
+                    self.frontier.mark_success(url_hash)
+                    return CrawlResult(
+                        url=url,
+                        success=True,
+                        crawl_timestamp=datetime.utcnow().isoformat() + "Z",
+                    )
         except Exception as e:
             logger.error(f"Error downloading PDF {url}: {e}")
             self.frontier.mark_failure(url_hash, str(e))
@@ -289,78 +424,102 @@ class IndiaAICrawler:
             crawl_timestamp=datetime.utcnow().isoformat() + "Z",
         )
         
-    def _extract_title(self, html: str) -> Optional[str]:
+    def _extract_title(self, tree: lxml_html.HtmlElement) -> Optional[str]:
         """Extract page title."""
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Try h1 first
-        h1 = soup.find("h1")
-        if h1:
-            return h1.get_text(strip=True)
-            
-        # Fallback to title tag
-        title = soup.find("title")
-        if title:
-            return title.get_text(strip=True)
+        # Single walk over the shared tree: the first h1 wins, otherwise
+        # fall back to the first title tag seen on the way
+        title = None
+        for element in tree.iter("h1", "title"):
+            if element.tag == "h1":
+                return element_text(element)
+            if title is None:
+                title = element
+                
+        if title is not None:
+            return element_text(title)
             
         return None
         
-    def _extract_outbound_links(self, html: str, base_url: str) -> List[OutboundLink]:
-        """Extract outbound links with classification."""
-        links = extract_links(html, base_url)
+    def _process_links(self, links: List[Tuple[str, str]], base_url: str, current_depth: int) -> Tuple[List[OutboundLink], int]:
+        """
+        Classify outbound links and enqueue new in-scope ones in one pass.
         
+        Returns:
+            (outbound_links, number of newly discovered URLs)
+        """
         outbound_links = []
+        seen = set()
+        to_enqueue = []
+        
         for href, text in links:
-            link_type = classify_link_text(text)
-            outbound_links.append(OutboundLink(
+            # Fields come straight from the parser, so skip validation
+            outbound_links.append(OutboundLink.model_construct(
                 href=href,
                 text=text,
-                link_type=link_type
+                link_type=LinkType(classify_link_text(text))
             ))
             
-        return outbound_links
-        
-    def _discover_links(self, html: str, base_url: str, current_depth: int) -> int:
-        """Discover and enqueue new links."""
-        links = extract_links(html, base_url)
-        
-        discovered = 0
-        for href, _ in links:
-            if is_in_scope(href):
-                canonical = canonicalize_url(href)
-                
-                # Apply section filter if set
-                if self.section_filter and not self.section_filter(canonical):
-                    logger.debug(f"Skipping URL (not in section): {canonical}")
-                    continue
+            # Pages often link the same href several times (nav, footer, body)
+            if href in seen or not is_in_scope(href):
+                continue
+            seen.add(href)
+            
+            canonical = canonicalize_url(href)
+            
+            # Apply section filter if set
+            if self.section_filter and not self.section_filter(canonical):
+                logger.debug(f"Skipping URL (not in section): {canonical}")
+                continue
                 
-                if self.frontier.enqueue(canonical, current_depth + 1, base_url):
-                    discovered += 1
-                    
-        return discovered
+            to_enqueue.append((canonical, current_depth + 1, base_url))
+            
+        # One transaction per page instead of one commit per link
+        discovered = self.frontier.enqueue_many(to_enqueue)
+        return outbound_links, discovered
         
-    def _save_result(self, result: CrawlResult):
-        """Save crawl result to disk."""
+    async def _save_result(self, result: CrawlResult):
+        """
+        Write a crawl result to disk on the writer thread.
+        
+        Awaiting the write gives backpressure: a worker can't run ahead of
+        the disk, while other workers keep crawling in the meantime.
+        """
         if not result.page_document:
             return
             
-        # Save page document
-        doc_file = config.output_dir / "documents" / f"{result.page_document.doc_id}.json"
-        with open(doc_file, "w", encoding="utf-8") as f:
-            json.dump(result.page_document.model_dump(), f, indent=2, ensure_ascii=False)
+        # pydantic-core serializes straight to JSON without building dicts
+        doc_id = result.page_document.doc_id
+        doc_json = result.page_document.model_dump_json().encode()
+        chunks = [(chunk.chunk_id, chunk.model_dump_json().encode()) for chunk in result.chunks]
+        
+        await self._on_writer(self._write_result, doc_id, doc_json, chunks)
+        
+    async def _on_writer(self, fn, *args):
+        """Run a blocking file operation on the writer thread and await its result."""
+        return await asyncio.wrap_future(self._writer.submit(fn, *args))
+        
+    def _write_result(self, doc_id: str, doc_json: bytes, chunks: List[Tuple[str, bytes]]):
+        """
+        Write a document and its chunks; runs on the writer thread.
+        
+        Errors propagate to the awaiting worker, which marks the URL failed.
+        """
+        # Save page document. It is only read back by the exporters, so it
+        # is written compact and the same bytes are reused for the JSONL line.
+        doc_file = config.output_dir / "documents" / f"{doc_id}.json"
+        with open(doc_file, "wb") as f:
+            f.write(doc_json)
             
         # Append to consolidated JSONL file
-        jsonl_file = config.output_dir / "all_data.jsonl"
-        with open(jsonl_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(result.page_document.model_dump(), ensure_ascii=False) + "\n")
-            
+        self._jsonl_file.write(doc_json + b"\n")
+        
         # Save chunks
-        for chunk in result.chunks:
-            chunk_file = config.output_dir / "chunks" / f"{chunk.chunk_id}.json"
-            with open(chunk_file, "w", encoding="utf-8") as f:
-                json.dump(chunk.model_dump(), f, indent=2, ensure_ascii=False)
+        for chunk_id, chunk_json in chunks:
+            chunk_file = config.output_dir / "chunks" / f"{chunk_id}.json"
+            with open(chunk_file, "wb") as f:
+                f.write(chunk_json)
                 
-        logger.debug(f"Saved document {result.page_document.doc_id} with {len(result.chunks)} chunks")
+        logger.debug(f"Saved document {doc_id} with {len(chunks)} chunks")
         
     def _export_consolidated_json(self):
         """Export all scraped data to a consolidated JSON file."""
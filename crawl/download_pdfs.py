@@ -1,53 +1,97 @@
 """Download PDFs from a list of URLs."""
+import asyncio
 import os
 import sys
 import io
-import requests
+import aiohttp
 from pathlib import Path
-from urllib.parse import unquote
+from typing import List
+from urllib.parse import unquote, urlsplit
+
+from config import config
 
 # Force UTF-8 encoding for Windows console
 if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Concurrency caps for PDF downloads
+MAX_CONCURRENT_DOWNLOADS = 64
+MAX_PER_HOST = 8
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _pdf_filename(url: str) -> str:
+    """Build a safe local filename from a PDF URL."""
+    # Links may carry a query string or fragment after the ".pdf"
+    filename = unquote(urlsplit(url).path.split("/")[-1])
+    # Sanitize filename
+    return "".join(c for c in filename if c.isalnum() or c in (' ', '.', '_', '-'))
+
+
+async def _download_one(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str, output_dir: Path) -> bool:
+    """Download a single PDF with exponential back-off retries."""
+    filename = _pdf_filename(url)
+    save_path = output_dir / filename
+    
+    async with semaphore:
+        for attempt in range(config.max_retries):
+            try:
+                print(f"Downloading: {filename}...")
+                
+                # ssl=False because of potential SSL issues with govt sites
+                async with session.get(url, ssl=False) as response:
+                    response.raise_for_status()
+                    
+                    with open(save_path, "wb") as f:
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            
+                print(f"✓ Saved to {save_path}")
+                return True
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Client errors (other than rate limiting) won't succeed on retry
+                retryable = not (isinstance(e, aiohttp.ClientResponseError) and e.status < 500 and e.status != 429)
+                if retryable and attempt + 1 < config.max_retries:
+                    await asyncio.sleep(config.retry_backoff_factor ** attempt)
+                    continue
+                print(f"❌ Failed to download {url}: {e}")
+                break
+            except Exception as e:
+                print(f"❌ Failed to download {url}: {e}")
+                break
+                
+    return False
+
+
+async def download_pdfs_async(urls: List[str], output_dir: Path = Path("output/pdfs")) -> int:
+    """Download PDFs concurrently; returns the number saved."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_DOWNLOADS, limit_per_host=MAX_PER_HOST)
+    
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = [asyncio.create_task(_download_one(session, semaphore, url, output_dir)) for url in urls]
+        results = await asyncio.gather(*tasks)
+        
+    return sum(results)
+
+
 def download_pdfs(links_file: str = "pdf_links.txt", output_dir: Path = Path("output/pdfs")):
     """Download PDFs from the links file."""
     if not os.path.exists(links_file):
         print(f"File {links_file} not found.")
         return
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
     with open(links_file, "r", encoding="utf-8") as f:
         urls = [line.strip() for line in f if line.strip()]
         
     print(f"Found {len(urls)} PDFs to download.")
     
-    for url in urls:
-        try:
-            filename = unquote(url.split("/")[-1])
-            # Sanitize filename
-            filename = "".join(c for c in filename if c.isalnum() or c in (' ', '.', '_', '-'))
-            save_path = output_dir / filename
-            
-            print(f"Downloading: {filename}...")
-            
-            response = requests.get(url, stream=True, verify=False) # verify=False because of potential SSL issues with govt sites
-            response.raise_for_status()
-            
-            with open(save_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    
-            print(f"✓ Saved to {save_path}")
-            
-        except Exception as e:
-            print(f"❌ Failed to download {url}: {e}")
+    saved = asyncio.run(download_pdfs_async(urls, output_dir))
+    print(f"Downloaded {saved}/{len(urls)} PDFs.")
 
 if __name__ == "__main__":
-    # Disable SSL warnings
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    
     download_pdfs()
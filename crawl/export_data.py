@@ -1,24 +1,62 @@
 """Export all scraped data to a single consolidated JSON file."""
-import json
+import os
+import orjson
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, BinaryIO
 
 
 def load_json_file(file_path: Path) -> Dict[str, Any]:
     """Load a single JSON file."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
     except Exception as e:
         print(f"Error loading {file_path}: {e}")
         return None
 
 
+def _json_files(directory: Path) -> Iterator[Path]:
+    """Yield the .json files directly inside a directory (none if it is missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield Path(entry.path)
+    except FileNotFoundError:
+        return
+
+
+def _write_section(out: BinaryIO, name: str, files: Iterable[Path], first: bool = False) -> int:
+    """
+    Stream a JSON array of file contents into an open export file.
+    
+    Returns:
+        Number of records written
+    """
+    out.write(b"" if first else b",\n")
+    out.write(b'"' + name.encode() + b'": [')
+    
+    count = 0
+    for file_path in files:
+        data = load_json_file(file_path)
+        if not data:
+            continue
+        out.write(b"\n" if count == 0 else b",\n")
+        out.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        count += 1
+        
+    out.write(b"\n]" if count else b"]")
+    return count
+
+
 def export_all_data(output_dir: Path = Path("output"), export_filename: str = None):
     """
     Export all scraped data to a single consolidated JSON file.
     
+    Records are streamed to disk one file at a time, so memory use does
+    not grow with the number of documents.
+    
     Args:
         output_dir: Directory containing scraped data
         export_filename: Name of output file (default: scraped_data_TIMESTAMP.json)
@@ -29,60 +67,44 @@ def export_all_data(output_dir: Path = Path("output"), export_filename: str = No
     
     export_path = output_dir / export_filename
     
-    # Collect all documents
     documents_dir = output_dir / "documents"
-    documents = []
-    
-    if documents_dir.exists():
-        print(f"Loading documents from {documents_dir}...")
-        for doc_file in documents_dir.glob("*.json"):
-            doc_data = load_json_file(doc_file)
-            if doc_data:
-                documents.append(doc_data)
-        print(f"  Loaded {len(documents)} documents")
-    
-    # Collect all chunks
     chunks_dir = output_dir / "chunks"
-    chunks = []
-    
-    if chunks_dir.exists():
-        print(f"Loading chunks from {chunks_dir}...")
-        for chunk_file in chunks_dir.glob("*.json"):
-            chunk_data = load_json_file(chunk_file)
-            if chunk_data:
-                chunks.append(chunk_data)
-        print(f"  Loaded {len(chunks)} chunks")
-    
-    # Collect PDF metadata
     pdfs_dir = output_dir / "pdfs"
-    pdfs = []
-    
-    if pdfs_dir.exists():
-        print(f"Loading PDF metadata from {pdfs_dir}...")
-        for pdf_meta in pdfs_dir.glob("*.json"):
-            pdf_data = load_json_file(pdf_meta)
-            if pdf_data:
-                pdfs.append(pdf_data)
-        print(f"  Loaded {len(pdfs)} PDF metadata files")
-    
-    # Create consolidated export
-    export_data = {
-        "export_metadata": {
-            "export_timestamp": datetime.utcnow().isoformat() + "Z",
-            "total_documents": len(documents),
-            "total_chunks": len(chunks),
-            "total_pdfs": len(pdfs),
-            "source_directory": str(output_dir.absolute())
-        },
-        "documents": documents,
-        "chunks": chunks,
-        "pdfs": pdfs
-    }
     
     # Write to JSON file
     print(f"\nWriting consolidated data to {export_path}...")
-    with open(export_path, "w", encoding="utf-8") as f:
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
+    with open(export_path, "wb") as f:
+        f.write(b"{\n")
+        
+        # Collect all documents
+        if documents_dir.exists():
+            print(f"Loading documents from {documents_dir}...")
+        num_documents = _write_section(f, "documents", _json_files(documents_dir), first=True)
+        print(f"  Loaded {num_documents} documents")
+        
+        # Collect all chunks
+        if chunks_dir.exists():
+            print(f"Loading chunks from {chunks_dir}...")
+        num_chunks = _write_section(f, "chunks", _json_files(chunks_dir))
+        print(f"  Loaded {num_chunks} chunks")
+        
+        # Collect PDF metadata
+        if pdfs_dir.exists():
+            print(f"Loading PDF metadata from {pdfs_dir}...")
+        num_pdfs = _write_section(f, "pdfs", _json_files(pdfs_dir))
+        print(f"  Loaded {num_pdfs} PDF metadata files")
+        
+        # Metadata goes last so the counts reflect what was actually written
+        export_metadata = {
+            "export_timestamp": datetime.utcnow().isoformat() + "Z",
+            "total_documents": num_documents,
+            "total_chunks": num_chunks,
+            "total_pdfs": num_pdfs,
+            "source_directory": str(output_dir.absolute())
+        }
+        f.write(b',\n"export_metadata": ')
+        f.write(orjson.dumps(export_metadata, option=orjson.OPT_INDENT_2))
+        f.write(b"\n}\n")
     
     file_size_mb = export_path.stat().st_size / (1024 * 1024)
     
@@ -92,9 +114,9 @@ def export_all_data(output_dir: Path = Path("output"), export_filename: str = No
     print(f"File: {export_path.absolute()}")
     print(f"Size: {file_size_mb:.2f} MB")
     print(f"\nContents:")
-    print(f"  - Documents: {len(documents)}")
-    print(f"  - Chunks: {len(chunks)}")
-    print(f"  - PDFs: {len(pdfs)}")
+    print(f"  - Documents: {num_documents}")
+    print(f"  - Chunks: {num_chunks}")
+    print(f"  - PDFs: {num_pdfs}")
     print(f"{'='*60}")
     
     return export_path
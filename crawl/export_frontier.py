@@ -1,8 +1,19 @@
 """Export frontier database to JSON format."""
 import sqlite3
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime
+from frontier import Status, URLFrontier
+
+
+# Rows fetched from SQLite per round trip while streaming the export
+FETCH_BATCH_SIZE = 5000
+
+# Status names for the stored status integers
+_STATUS_NAME = " ".join(f"WHEN {status:d} THEN '{status.name.lower()}'" for status in Status)
+
+# Epoch-millisecond column as the ISO-8601 string the export has always used
+_ISO_MS = "strftime('%Y-%m-%dT%H:%M:%fZ', {column} / 1000.0, 'unixepoch')"
 
 
 def export_frontier_to_json(db_path: Path = Path("frontier.db"), output_path: Path = None):
@@ -19,13 +30,44 @@ def export_frontier_to_json(db_path: Path = Path("frontier.db"), output_path: Pa
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
+    # Opening through URLFrontier first migrates a database written by an
+    # older version, so the queries below always see the current schema
+    with URLFrontier(db_path):
+        pass
+    
     # Connect to database
     conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
-    cursor = conn.cursor()
+    
+    # Larger page cache and memory-mapped reads for the full-table scan
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    
+    # Get statistics first so they can lead the streamed export
+    stats_row = conn.execute(f"""
+        SELECT 
+            COUNT(*) as total,
+            SUM(CASE WHEN status = {Status.PENDING:d} THEN 1 ELSE 0 END) as pending,
+            SUM(CASE WHEN status = {Status.SUCCESS:d} THEN 1 ELSE 0 END) as success,
+            SUM(CASE WHEN status = {Status.FAILED:d} THEN 1 ELSE 0 END) as failed,
+            SUM(CASE WHEN status = {Status.IN_PROGRESS:d} THEN 1 ELSE 0 END) as in_progress
+        FROM urls
+    """).fetchone()
+    stats = {
+        "total": stats_row[0],
+        "pending": stats_row[1] or 0,
+        "success": stats_row[2] or 0,
+        "failed": stats_row[3] or 0,
+        "in_progress": stats_row[4] or 0
+    }
+    
+    header = {
+        "export_timestamp": datetime.utcnow().isoformat() + "Z",
+        "database_path": str(db_path),
+        "statistics": stats,
+    }
     
     # Fetch all URLs
-    cursor.execute("""
+    cursor = conn.execute(f"""
         SELECT 
             url_hash,
             url,
@@ -33,71 +75,39 @@ def export_frontier_to_json(db_path: Path = Path("frontier.db"), output_path: Pa
             depth,
             parent_url,
             priority,
-            status,
+            CASE status {_STATUS_NAME} END AS status,
             attempts,
-            last_crawled,
+            {_ISO_MS.format(column="last_crawled")} AS last_crawled,
             etag,
             last_modified,
             error_message,
-            created_at
+            {_ISO_MS.format(column="created_at")} AS created_at
         FROM urls
         ORDER BY priority DESC, created_at ASC
     """)
+    columns = [description[0] for description in cursor.description]
     
-    # Convert to list of dictionaries
-    urls = []
-    for row in cursor.fetchall():
-        urls.append({
-            "url_hash": row["url_hash"],
-            "url": row["url"],
-            "canonical_url": row["canonical_url"],
-            "depth": row["depth"],
-            "parent_url": row["parent_url"],
-            "priority": row["priority"],
-            "status": row["status"],
-            "attempts": row["attempts"],
-            "last_crawled": row["last_crawled"],
-            "etag": row["etag"],
-            "last_modified": row["last_modified"],
-            "error_message": row["error_message"],
-            "created_at": row["created_at"]
-        })
-    
-    # Get statistics
-    cursor.execute("""
-        SELECT 
-            COUNT(*) as total,
-            SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-            SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success,
-            SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-            SUM(CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END) as in_progress
-        FROM urls
-    """)
-    
-    stats_row = cursor.fetchone()
-    stats = {
-        "total": stats_row["total"],
-        "pending": stats_row["pending"] or 0,
-        "success": stats_row["success"] or 0,
-        "failed": stats_row["failed"] or 0,
-        "in_progress": stats_row["in_progress"] or 0
-    }
+    # Stream rows to the JSON file in batches instead of building a list
+    url_count = 0
+    with open(output_path, "wb") as f:
+        # Reuse the header's serialization, leaving the object open for "urls"
+        f.write(orjson.dumps(header, option=orjson.OPT_INDENT_2)[:-2])
+        f.write(b',\n  "urls": [')
+        
+        while True:
+            rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                f.write(b"\n" if url_count == 0 else b",\n")
+                f.write(orjson.dumps(dict(zip(columns, row))))
+                url_count += 1
+                
+        f.write(b"\n  ]\n}" if url_count else b"]\n}")
     
     conn.close()
     
-    # Create export data
-    export_data = {
-        "export_timestamp": datetime.utcnow().isoformat() + "Z",
-        "database_path": str(db_path),
-        "statistics": stats,
-        "urls": urls
-    }
-    
-    # Write to JSON file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
-    
-    print(f"Exported {len(urls)} URLs to {output_path}")
+    print(f"Exported {url_count} URLs to {output_path}")
     print(f"\nStatistics:")
     print(f"  Total URLs: {stats['total']}")
     print(f"  Pending: {stats['pending']}")
@@ -1,17 +1,28 @@
 """Agenda item extractor."""
 from typing import List
-from bs4 import BeautifulSoup
-import hashlib
+from bs4 import Tag
+from soup_utils import make_soup
+import re
 from .base import BaseExtractor
+from ids import make_id
 from models import AgendaItem, Entity
 
 
+# Pattern: HH:MM - HH:MM: Title
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2})\s*[-–]\s*(\d{1,2}:\d{2})\s*[:-]?\s*(.+)')
+
+
 class AgendaExtractor(BaseExtractor):
     """Extract agenda items from agenda pages."""
     
-    def extract(self, html: str, markdown: str, url: str) -> List[Entity]:
+    def extract(
+        self,
+        html: str,
+        markdown: str,
+        url: str
+    ) -> List[Entity]:
         """Extract agenda items from page."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         entities = []
         
         # Strategy 1: Look for structured agenda blocks
@@ -37,10 +48,15 @@ class AgendaExtractor(BaseExtractor):
         items = []
         
         for heading, day_name in day_sections:
-            # Get all content until next day section
+            # Get all content until next day section. next_siblings is lazy, so
+            # the walk stops at the next day heading instead of materializing
+            # every remaining sibling first; with day headings side by side
+            # the whole page is walked once.
             current_items = []
             
-            for sibling in heading.find_next_siblings():
+            for sibling in heading.next_siblings:
+                if not isinstance(sibling, Tag):
+                    continue
                 if sibling.name in ["h2", "h3"] and "day" in sibling.get_text().lower():
                     break
                     
@@ -49,19 +65,14 @@ class AgendaExtractor(BaseExtractor):
                 if not text:
                     continue
                     
-                # Try to parse time-based entries
-                # Pattern: HH:MM - HH:MM: Title
-                import re
-                time_pattern = r'(\d{1,2}:\d{2})\s*[-–]\s*(\d{1,2}:\d{2})\s*[:-]?\s*(.+)'
-                match = re.match(time_pattern, text)
+                # Try to parse time-based entries (they always start with a digit)
+                match = _TIME_RE.match(text) if text[0].isdigit() else None
                 
                 if match:
                     start_time, end_time, title = match.groups()
                     
                     # Generate entity ID
-                    entity_id = hashlib.sha256(
-                        f"{url}_{day_name}_{start_time}_{title}".encode()
-                    ).hexdigest()
+                    entity_id = make_id(url, day_name, start_time, title)
                     
                     item = AgendaItem(
                         entity_id=entity_id,
@@ -77,9 +88,7 @@ class AgendaExtractor(BaseExtractor):
                 else:
                     # No time pattern, treat as description or standalone item
                     if len(text) > 20:  # Meaningful content
-                        entity_id = hashlib.sha256(
-                            f"{url}_{day_name}_{text[:50]}".encode()
-                        ).hexdigest()
+                        entity_id = make_id(url, day_name, text[:50])
                         
                         item = AgendaItem(
                             entity_id=entity_id,
@@ -111,17 +120,16 @@ class AgendaExtractor(BaseExtractor):
                 current_day = line.lstrip("#").strip()
                 continue
                 
-            # Detect time-based entries
-            import re
-            time_pattern = r'(\d{1,2}:\d{2})\s*[-–]\s*(\d{1,2}:\d{2})\s*[:-]?\s*(.+)'
-            match = re.match(time_pattern, line)
-            
+            # Detect time-based entries; skip the regex for lines that
+            # can't start with a time
+            if not line[0].isdigit():
+                continue
+                
+            match = _TIME_RE.match(line)
             if match:
                 start_time, end_time, title = match.groups()
                 
-                entity_id = hashlib.sha256(
-                    f"{url}_{current_day}_{start_time}_{title}".encode()
-                ).hexdigest()
+                entity_id = make_id(url, current_day, start_time, title)
                 
                 item = AgendaItem(
                     entity_id=entity_id,
@@ -1,17 +1,50 @@
 """Base extractor interface and utilities."""
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 import re
 from datetime import datetime
 from models import Entity
 
 
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Common date formats, in the order they are tried
+_DATE_FORMATS = [
+    "%B %d, %Y",      # December 11, 2025
+    "%d-%m-%Y",       # 11-12-2025
+    "%Y-%m-%d",       # 2025-12-11
+    "%d/%m/%Y",       # 11/12/2025
+    "%m/%d/%Y",       # 12/11/2025
+    "%d %B %Y",       # 11 December 2025
+]
+
+# String shape -> the only formats that could parse it. Shapes with no
+# candidates can't match any format and are returned as-is; anything
+# unrecognized still goes through the full list.
+_DATE_SHAPES = [
+    (re.compile(r'[A-Za-z]+\s+\d{1,2},\s+\d{4}'), ["%B %d, %Y"]),
+    (re.compile(r'\d{1,2}-\d{1,2}-\d{4}'), ["%d-%m-%Y"]),
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}'), ["%Y-%m-%d"]),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'), ["%d/%m/%Y", "%m/%d/%Y"]),
+    (re.compile(r'\d{1,2}\s+[A-Za-z]+\s+\d{4}'), ["%d %B %Y"]),
+    # Joined regex groups from EventExtractor and ISO timestamps
+    (re.compile(r'[A-Za-z]+\s+\d{1,2}\s+\d{4}'), []),
+    (re.compile(r'\d{1,2}\s+\d{1,2}\s+\d{4}'), []),
+    (re.compile(r'\d{4}-\d{2}-\d{2}[T ].+'), []),
+]
+
+
 class BaseExtractor(ABC):
     """Abstract base class for content extractors."""
     
     @abstractmethod
-    def extract(self, html: str, markdown: str, url: str) -> List[Entity]:
+    def extract(
+        self,
+        html: str,
+        markdown: str,
+        url: str
+    ) -> List[Entity]:
         """
         Extract entities from page content.
         
@@ -30,12 +63,13 @@ class BaseExtractor(ABC):
         if not text:
             return None
             
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
+        # Remove extra whitespace; str.split() uses the same whitespace
+        # definition as \s and collapses and strips in one C-level pass
+        text = ' '.join(text.split())
         
         # Remove HTML artifacts
-        text = re.sub(r'<[^>]+>', '', text)
+        if '<' in text:
+            text = _TAG_RE.sub('', text)
         
         return text if text else None
         
@@ -55,16 +89,13 @@ class BaseExtractor(ABC):
         if not date_str:
             return None
             
-        # Try common formats
-        formats = [
-            "%B %d, %Y",      # December 11, 2025
-            "%d-%m-%Y",       # 11-12-2025
-            "%Y-%m-%d",       # 2025-12-11
-            "%d/%m/%Y",       # 11/12/2025
-            "%m/%d/%Y",       # 12/11/2025
-            "%d %B %Y",       # 11 December 2025
-        ]
-        
+        # Only try the formats that fit the string's shape
+        formats = _DATE_FORMATS
+        for shape, candidates in _DATE_SHAPES:
+            if shape.fullmatch(date_str):
+                formats = candidates
+                break
+                
         for fmt in formats:
             try:
                 dt = datetime.strptime(date_str, fmt)
@@ -79,10 +110,11 @@ class BaseExtractor(ABC):
         """Extract common metadata from HTML."""
         metadata = {}
         
-        # Meta tags
-        for meta in soup.find_all("meta"):
-            name = meta.get("name") or meta.get("property")
-            content = meta.get("content")
+        # Meta tags; only those carrying content can contribute
+        for meta in soup.find_all("meta", attrs={"content": True}):
+            attrs = meta.attrs
+            name = attrs.get("name") or attrs.get("property")
+            content = attrs["content"]
             if name and content:
                 metadata[name] = content
                 
@@ -94,7 +126,9 @@ class BaseExtractor(ABC):
             if heading_text.lower() in heading.get_text().lower():
                 # Get all siblings until next heading
                 content = []
-                for sibling in heading.find_next_siblings():
+                for sibling in heading.next_siblings:
+                    if not isinstance(sibling, Tag):
+                        continue
                     if sibling.name in ["h1", "h2", "h3", "h4"]:
                         break
                     content.append(sibling.get_text(strip=True))
@@ -1,18 +1,64 @@
 """Event extractor for working-group pages and event listings."""
-from typing import List, Optional
-from bs4 import BeautifulSoup
-import hashlib
+from typing import List, Optional, Tuple
+from bs4 import BeautifulSoup, Tag
+from soup_utils import make_soup
 import re
+import soupsieve as sv
 from .base import BaseExtractor
+from ids import make_id, id_maker
 from models import Event, Entity
 
 
+_MONTHS = r'(January|February|March|April|May|June|July|August|September|October|November|December)'
+
+# Pattern: Month DD, YYYY or DD Month YYYY
+_DATE_PATTERNS = [
+    re.compile(_MONTHS + r'\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE),
+    re.compile(r'(\d{1,2})\s+' + _MONTHS + r'\s+(\d{4})', re.IGNORECASE),
+    re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', re.IGNORECASE),
+]
+
+# Simple pattern: City, Country
+_LOCATION_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z][a-z]+)')
+
+# Pattern: "by X" or "organized by X"
+_ORGANIZER_RE = re.compile(r'(?:organized\s+)?by\s+([A-Z][^.,;]+)', re.IGNORECASE)
+
+# Divs whose class contains "event", "card" or "item" (any case); the
+# attribute match runs inside soupsieve instead of a Python callback
+_CARD_SELECTOR = sv.compile("div[class*=event i], div[class*=card i], div[class*=item i]")
+
+# Keywords marking a div or list item as event content. Matching case-
+# insensitively scans each text once without a lowercased copy.
+_DIV_KEYWORD_RE = re.compile(r"register|event|conclave|workshop|meeting", re.IGNORECASE)
+_LI_KEYWORD_RE = re.compile(r"register|event|date", re.IGNORECASE)
+
+# Link text marking a registration link
+_REGISTRATION_RE = re.compile(r"register|sign up|rsvp", re.IGNORECASE)
+
+
+def _card_texts(node: Tag) -> Tuple[str, str]:
+    """
+    Return node.get_text() and node.get_text(" ", strip=True) from a
+    single walk of the node's strings.
+    """
+    strings = list(node.strings)
+    raw = "".join(strings)
+    spaced = " ".join(filter(None, (string.strip() for string in strings)))
+    return raw, spaced
+
+
 class EventExtractor(BaseExtractor):
     """Extract event entities from event listings and working-group pages."""
     
-    def extract(self, html: str, markdown: str, url: str) -> List[Entity]:
+    def extract(
+        self,
+        html: str,
+        markdown: str,
+        url: str
+    ) -> List[Entity]:
         """Extract events from page."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         entities = []
         
         # Strategy 1: Look for event cards/blocks
@@ -26,35 +72,49 @@ class EventExtractor(BaseExtractor):
             
         return entities
         
-    def _find_event_cards(self, soup: BeautifulSoup) -> List:
-        """Find event card elements in HTML."""
+    def _find_event_cards(self, soup: BeautifulSoup) -> List[Tuple[Tag, str]]:
+        """
+        Find event card elements in HTML.
+        
+        Returns (card, text) pairs, where text is the card's space-joined
+        text so it doesn't have to be collected again.
+        """
         cards = []
         
         # Common patterns for event cards
         # 1. Divs with class containing "event", "card", "item"
-        for div in soup.find_all("div", class_=re.compile(r"event|card|item", re.I)):
+        for div in _CARD_SELECTOR.select(soup):
             # Check if it contains event-like content
-            text = div.get_text()
-            if any(keyword in text.lower() for keyword in ["register", "event", "conclave", "workshop", "meeting"]):
-                cards.append(div)
+            raw, text = _card_texts(div)
+            if _DIV_KEYWORD_RE.search(raw):
+                cards.append((div, text))
                 
         # 2. Article tags
-        cards.extend(soup.find_all("article"))
-        
+        for article in soup.find_all("article"):
+            cards.append((article, article.get_text(separator=" ", strip=True)))
+            
         # 3. List items in event sections
         for ul in soup.find_all("ul"):
             for li in ul.find_all("li"):
-                text = li.get_text()
-                if len(text) > 50 and any(keyword in text.lower() for keyword in ["register", "event", "date"]):
-                    cards.append(li)
+                raw, text = _card_texts(li)
+                if len(raw) > 50 and _LI_KEYWORD_RE.search(raw):
+                    cards.append((li, text))
                     
         return cards
         
-    def _extract_from_cards(self, cards: List, url: str) -> List[Event]:
+    def _extract_from_cards(self, cards: List[Tuple[Tag, str]], url: str) -> List[Event]:
         """Extract event data from card elements."""
         events = []
         
-        for card in cards:
+        # Per-page values shared by every card
+        make_card_id = id_maker(url)
+        working_group = None
+        if "working-group" in url:
+            parts = url.split("working-groups/")
+            if len(parts) > 1:
+                working_group = parts[1].split("/")[0].replace("-", " ").title()
+                
+        for card, text in cards:
             # Extract title
             title_elem = card.find(["h1", "h2", "h3", "h4", "h5", "strong", "b"])
             title = title_elem.get_text(strip=True) if title_elem else None
@@ -62,9 +122,6 @@ class EventExtractor(BaseExtractor):
             if not title:
                 continue
                 
-            # Extract text content
-            text = card.get_text(separator=" ", strip=True)
-            
             # Extract date
             date = self._extract_date_from_text(text)
             
@@ -77,22 +134,12 @@ class EventExtractor(BaseExtractor):
             # Extract registration link
             registration_url = None
             for link in card.find_all("a"):
-                link_text = link.get_text().lower()
-                if any(keyword in link_text for keyword in ["register", "sign up", "rsvp"]):
+                if _REGISTRATION_RE.search(link.get_text()):
                     registration_url = link.get("href")
                     break
                     
-            # Extract working group from URL
-            working_group = None
-            if "working-group" in url:
-                parts = url.split("working-groups/")
-                if len(parts) > 1:
-                    working_group = parts[1].split("/")[0].replace("-", " ").title()
-                    
             # Generate entity ID
-            entity_id = hashlib.sha256(
-                f"{url}_{title}_{date}".encode()
-            ).hexdigest()
+            entity_id = make_card_id(title, date)
             
             event = Event(
                 entity_id=entity_id,
@@ -114,47 +161,51 @@ class EventExtractor(BaseExtractor):
     def _extract_from_markdown(self, markdown: str, url: str) -> List[Event]:
         """Extract events from markdown structure."""
         events = []
-        lines = markdown.split("\n")
         
-        current_event = {}
+        # Current event state; description lines are joined once per event
+        # rather than concatenated line by line
+        title = None
+        description_lines = []
+        date = None
+        
+        extract_date = self._extract_date_from_text
         
-        for line in lines:
+        for line in markdown.split("\n"):
             line = line.strip()
             if not line:
                 continue
                 
             # Detect event headings
-            if line.startswith("#"):
+            if line[0] == "#":
                 # Save previous event if exists
-                if current_event.get("title"):
-                    events.append(self._create_event_from_dict(current_event, url))
+                if title:
+                    events.append(self._create_event_from_dict(
+                        {"title": title, "description": " ".join(description_lines), "date": date}, url
+                    ))
                     
                 # Start new event
-                current_event = {"title": line.lstrip("#").strip()}
+                title = line.lstrip("#").strip()
+                description_lines = []
+                date = None
             else:
                 # Accumulate description
-                if "description" not in current_event:
-                    current_event["description"] = line
-                else:
-                    current_event["description"] += " " + line
-                    
+                description_lines.append(line)
+                
                 # Extract date if found
-                if not current_event.get("date"):
-                    date = self._extract_date_from_text(line)
-                    if date:
-                        current_event["date"] = date
-                        
+                if not date:
+                    date = extract_date(line)
+                    
         # Save last event
-        if current_event.get("title"):
-            events.append(self._create_event_from_dict(current_event, url))
+        if title:
+            events.append(self._create_event_from_dict(
+                {"title": title, "description": " ".join(description_lines), "date": date}, url
+            ))
             
         return events
         
     def _create_event_from_dict(self, data: dict, url: str) -> Event:
         """Create Event entity from dictionary."""
-        entity_id = hashlib.sha256(
-            f"{url}_{data.get('title')}_{data.get('date')}".encode()
-        ).hexdigest()
+        entity_id = make_id(url, data.get('title'), data.get('date'))
         
         return Event(
             entity_id=entity_id,
@@ -167,15 +218,8 @@ class EventExtractor(BaseExtractor):
         
     def _extract_date_from_text(self, text: str) -> Optional[str]:
         """Extract date from text using patterns."""
-        # Pattern: Month DD, YYYY or DD Month YYYY
-        date_patterns = [
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})',
-            r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return self.parse_date(" ".join(match.groups()))
                 
@@ -183,9 +227,7 @@ class EventExtractor(BaseExtractor):
         
     def _extract_location(self, text: str) -> tuple:
         """Extract city and country from text."""
-        # Simple pattern: City, Country
-        location_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z][a-z]+)'
-        match = re.search(location_pattern, text)
+        match = _LOCATION_RE.search(text)
         
         if match:
             return match.group(1), match.group(2)
@@ -193,9 +235,7 @@ class EventExtractor(BaseExtractor):
         
     def _extract_organizer(self, text: str) -> Optional[str]:
         """Extract organizer from text."""
-        # Pattern: "by X" or "organized by X"
-        organizer_pattern = r'(?:organized\s+)?by\s+([A-Z][^.,;]+)'
-        match = re.search(organizer_pattern, text, re.IGNORECASE)
+        match = _ORGANIZER_RE.search(text)
         
         if match:
             return self.clean_text(match.group(1))
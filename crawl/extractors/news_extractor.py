@@ -1,17 +1,29 @@
 """News and announcement extractor."""
 from typing import List, Optional
 from bs4 import BeautifulSoup
-import hashlib
+import soupsieve as sv
+from soup_utils import make_soup
 from .base import BaseExtractor
+from ids import make_id
 from models import NewsArticle, Entity
 
 
+# Case-insensitive class substring matches, evaluated by soupsieve
+_AUTHOR_SELECTOR = sv.compile("[class*=author i]")
+_CATEGORY_SELECTOR = sv.compile("[class*=category i]")
+
+
 class NewsExtractor(BaseExtractor):
     """Extract news articles and announcements."""
     
-    def extract(self, html: str, markdown: str, url: str) -> List[Entity]:
+    def extract(
+        self,
+        html: str,
+        markdown: str,
+        url: str
+    ) -> List[Entity]:
         """Extract news articles from page."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         entities = []
         
         # Strategy 1: Look for article tags
@@ -45,20 +57,18 @@ class NewsExtractor(BaseExtractor):
             publication_date = self.parse_date(date_elem.get("datetime") or date_elem.get_text())
             
         # Extract author
-        author_elem = article.find(class_=lambda x: x and "author" in x.lower())
+        author_elem = _AUTHOR_SELECTOR.select_one(article)
         author = author_elem.get_text(strip=True) if author_elem else None
         
         # Extract category
-        category_elem = article.find(class_=lambda x: x and "category" in x.lower())
+        category_elem = _CATEGORY_SELECTOR.select_one(article)
         category = category_elem.get_text(strip=True) if category_elem else None
         
         # Extract body
         body = article.get_text(separator=" ", strip=True)
         
         # Generate entity ID
-        entity_id = hashlib.sha256(
-            f"{url}_{headline}".encode()
-        ).hexdigest()
+        entity_id = make_id(url, headline)
         
         return NewsArticle(
             entity_id=entity_id,
@@ -84,9 +94,7 @@ class NewsExtractor(BaseExtractor):
         body = markdown
         
         # Generate entity ID
-        entity_id = hashlib.sha256(
-            f"{url}_{headline}".encode()
-        ).hexdigest()
+        entity_id = make_id(url, headline)
         
         return NewsArticle(
             entity_id=entity_id,
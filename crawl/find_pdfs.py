@@ -1,52 +1,93 @@
 """Find and extract PDF links from crawled JSON files."""
-import json
 import io
 import sys
+import os
+import re
+import ijson
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List
 
 # Force UTF-8 encoding for Windows console
 if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Where outbound link hrefs live in each JSON layout we write
+_DOCUMENTS_HREF = "documents.item.outbound_links.item.href"   # consolidated export
+_SINGLE_HREF = "outbound_links.item.href"                      # single document
+_LIST_HREF = "item.outbound_links.item.href"                   # list of documents
+
+# A ".pdf" path ending, optionally followed by a query string or fragment.
+# Searching avoids a lowercased copy of every href.
+_PDF_RE = re.compile(r"\.pdf(?:[?#]|$)", re.IGNORECASE)
+
+# Bytes ijson reads per call. Most crawled files fit in one read; large
+# consolidated exports take a few reads instead of one per 64KB.
+READ_BUFFER_SIZE = 1024 * 1024
+
+
+def _scan_one(json_file: Path) -> List[str]:
+    """
+    Return the PDF hrefs linked from one crawled JSON file.
+    
+    The file is streamed with ijson, so only the href strings are
+    materialized no matter how large the file is. Unreadable or
+    malformed files yield no links.
+    """
+    try:
+        return _scan_file(json_file)
+    except Exception as e:
+        # print(f"Error reading {json_file}: {e}")
+        return []
+
+
+def _scan_file(json_file: Path) -> List[str]:
+    """Stream one JSON file and collect its PDF hrefs."""
+    top_level = None
+    has_documents = False
+    found = {_DOCUMENTS_HREF: [], _SINGLE_HREF: [], _LIST_HREF: []}
+    
+    with open(json_file, "rb") as f:
+        for prefix, event, value in ijson.parse(f, buf_size=READ_BUFFER_SIZE):
+            if top_level is None:
+                top_level = event
+            elif prefix == "" and event == "map_key" and value == "documents":
+                has_documents = True
+            elif event == "string" and prefix in found and _PDF_RE.search(value):
+                found[prefix].append(value)
+                
+    # Handle different JSON structures (consolidated vs individual)
+    if top_level == "start_map":
+        return found[_DOCUMENTS_HREF] if has_documents else found[_SINGLE_HREF]
+    if top_level == "start_array":
+        return found[_LIST_HREF]
+    return []
+
+
 def find_pdfs(output_dir: Path = Path("output")):
     """Scan all JSON files in output directory for PDF links."""
     pdf_links = set()
     
     print(f"Scanning {output_dir} for PDF links...")
     
-    # Walk through all directories
-    for json_file in output_dir.rglob("*.json"):
-        # Skip metrics/log files
-        if "metrics" in json_file.name or "frontier" in json_file.name:
-            continue
-            
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            # Handle different JSON structures (consolidated vs individual)
-            docs = []
-            if "documents" in data:
-                docs = data["documents"]
-            elif isinstance(data, dict):
-                docs = [data]
-            elif isinstance(data, list):
-                docs = data
+    # Walk through all directories, skipping metrics/log files
+    paths = [
+        json_file for json_file in output_dir.rglob("*.json")
+        if "metrics" not in json_file.name and "frontier" not in json_file.name
+    ]
+    
+    # Files are independent, so scan them across processes; batch the
+    # files handed to each worker so pickling overhead stays small
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for hrefs in ex.map(_scan_one, paths, chunksize=chunksize):
+            for href in hrefs:
+                pdf_links.add(href)
+                print(f"Found PDF: {href}")
                 
-            for doc in docs:
-                # Check outbound links
-                if "outbound_links" in doc:
-                    for link in doc["outbound_links"]:
-                        href = link.get("href", "")
-                        if href.lower().endswith(".pdf"):
-                            pdf_links.add(href)
-                            print(f"Found PDF: {href}")
-                            
-        except Exception as e:
-            # print(f"Error reading {json_file}: {e}")
-            pass
-            
     print(f"\nTotal unique PDFs found: {len(pdf_links)}")
     
     # Save list to file
@@ -1,60 +1,182 @@
 """URL frontier with SQLite-backed priority queue."""
 import sqlite3
-import hashlib
-from datetime import datetime
+import threading
+import time
+from enum import IntEnum
 from typing import Optional, List, Tuple
 from pathlib import Path
 from config import config
 from logger import setup_logger
 from url_utils import canonicalize_url, get_url_priority
+from ids import url_key
 
 
 logger = setup_logger("frontier")
 
+# UPDATE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Stored in PRAGMA user_version. Version 1 keys urls by xxh3-128 instead
+# of SHA-256; version 2 stores status and timestamps as integers. Older
+# databases are migrated when opened.
+_SCHEMA_VERSION = 2
+
+
+class Status(IntEnum):
+    """Crawl status of a frontier URL, stored as a small integer."""
+    PENDING = 0
+    IN_PROGRESS = 1
+    SUCCESS = 2
+    FAILED = 3
+
+
+sqlite3.register_adapter(Status, int)
+
+# Status values inlined into SQL text; the dequeue query has to repeat the
+# partial index's literal WHERE clause for SQLite to use the index
+_PENDING = f"{Status.PENDING:d}"
+_IN_PROGRESS = f"{Status.IN_PROGRESS:d}"
+_SUCCESS = f"{Status.SUCCESS:d}"
+_FAILED = f"{Status.FAILED:d}"
+
+# Timestamps (created_at, last_crawled) are unix epoch milliseconds
+_URLS_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {{name}} (
+        url_hash TEXT PRIMARY KEY,
+        url TEXT NOT NULL,
+        canonical_url TEXT NOT NULL,
+        depth INTEGER NOT NULL,
+        parent_url TEXT,
+        priority INTEGER NOT NULL,
+        status INTEGER NOT NULL DEFAULT {_PENDING},
+        attempts INTEGER NOT NULL DEFAULT 0,
+        last_crawled INTEGER,
+        etag TEXT,
+        last_modified TEXT,
+        error_message TEXT,
+        created_at INTEGER NOT NULL
+    )
+"""
+
+
+def _now_ms() -> int:
+    """Current time as unix epoch milliseconds."""
+    return int(time.time() * 1000)
+
 
 class URLFrontier:
     """SQLite-backed URL frontier for crawl queue management."""
     
     def __init__(self, db_path: Path = Path("frontier.db")):
         self.db_path = db_path
+        self._lock = threading.Lock()
         self._init_db()
         
     def _init_db(self):
-        """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS urls (
-                url_hash TEXT PRIMARY KEY,
-                url TEXT NOT NULL,
-                canonical_url TEXT NOT NULL,
-                depth INTEGER NOT NULL,
-                parent_url TEXT,
-                priority INTEGER NOT NULL,
-                status TEXT NOT NULL DEFAULT 'pending',
-                attempts INTEGER NOT NULL DEFAULT 0,
-                last_crawled TEXT,
-                etag TEXT,
-                last_modified TEXT,
-                error_message TEXT,
-                created_at TEXT NOT NULL
-            )
-        """)
+        """Open the shared connection and initialize database schema."""
+        # One long-lived connection in autocommit mode; multi-statement
+        # work opens its own transaction. The lock serializes access so the
+        # connection can be shared across threads.
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        cursor = self.conn.cursor()
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_status_priority 
-            ON urls(status, priority DESC, created_at)
+        # WAL lets readers run alongside the writer and makes commits far
+        # cheaper; under WAL, synchronous=NORMAL only syncs at checkpoints
+        # and is still crash-safe
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-65536")
+        
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'urls'"
+        ).fetchone()
+        if exists:
+            self._migrate()
+        else:
+            cursor.execute(_URLS_TABLE.format(name="urls"))
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        
+        # Partial covering index for dequeue: it only holds pending rows
+        # (rows drop out as their status changes) and carries everything the
+        # claim subquery reads (status included, or SQLite falls back to the
+        # table), so picking the next URL is a probe at the front of a small
+        # B-tree. attempts is left out of the WHERE clause because the bound
+        # max_retries parameter can't be matched against it.
+        cursor.execute("DROP INDEX IF EXISTS idx_status_priority")
+        cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_pending
+            ON urls(priority DESC, created_at ASC, attempts, url_hash, status)
+            WHERE status = {_PENDING}
         """)
         
-        conn.commit()
-        conn.close()
         logger.info(f"Frontier database initialized at {self.db_path}")
         
+    def _migrate(self):
+        """Bring a database written by an older version up to date."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+            
+        self.conn.create_function("url_key", 1, url_key, deterministic=True)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            if version < 1:
+                # url_hash is derived from canonical_url alone, so old SHA-256
+                # keys can be recomputed in place. The two digests differ in
+                # length, so no new key can collide with an old one mid-update.
+                self.conn.execute("UPDATE urls SET url_hash = url_key(canonical_url)")
+                
+            if version < 2:
+                # The TEXT columns would coerce integers back to strings, so
+                # the table is rebuilt; its indexes go with the old table
+                self.conn.execute(_URLS_TABLE.format(name="urls_v2"))
+                self.conn.execute(f"""
+                    INSERT INTO urls_v2
+                    SELECT url_hash, url, canonical_url, depth, parent_url, priority,
+                        CASE status
+                            WHEN 'in_progress' THEN {_IN_PROGRESS}
+                            WHEN 'success' THEN {_SUCCESS}
+                            WHEN 'failed' THEN {_FAILED}
+                            ELSE {_PENDING}
+                        END,
+                        attempts,
+                        CAST(ROUND((julianday(rtrim(last_crawled, 'Z')) - 2440587.5) * 86400000) AS INTEGER),
+                        etag, last_modified, error_message,
+                        CAST(ROUND((julianday(rtrim(created_at, 'Z')) - 2440587.5) * 86400000) AS INTEGER)
+                    FROM urls
+                """)
+                self.conn.execute("DROP TABLE urls")
+                self.conn.execute("ALTER TABLE urls_v2 RENAME TO urls")
+                
+            migrated = self.conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+            self.conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+            
+        if migrated:
+            logger.info(f"Migrated {migrated} frontier URLs to schema version {_SCHEMA_VERSION}")
+        
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            # Refresh planner statistics for the queries this run issued
+            self.conn.execute("PRAGMA optimize")
+            self.conn.close()
+            
+    def __enter__(self) -> "URLFrontier":
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+            
     def _url_hash(self, url: str) -> str:
-        """Generate SHA256 hash of canonical URL."""
+        """Generate the lookup key of the canonical URL."""
         canonical = canonicalize_url(url)
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        return url_key(canonical)
         
     def enqueue(self, url: str, depth: int = 0, parent_url: Optional[str] = None) -> bool:
         """
@@ -67,12 +189,9 @@ class URLFrontier:
         url_hash = self._url_hash(url)
         priority = get_url_priority(canonical)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                INSERT INTO urls (url_hash, url, canonical_url, depth, parent_url, priority, created_at)
+        with self._lock:
+            added = self.conn.execute("""
+                INSERT OR IGNORE INTO urls (url_hash, url, canonical_url, depth, parent_url, priority, created_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (
                 url_hash,
@@ -81,16 +200,57 @@ class URLFrontier:
                 depth,
                 parent_url,
                 priority,
-                datetime.utcnow().isoformat() + "Z"
-            ))
-            conn.commit()
+                _now_ms()
+            )).rowcount == 1
+            
+        # Not added means the URL already exists
+        if added:
             logger.debug(f"Enqueued: {canonical} (depth={depth}, priority={priority})")
-            return True
-        except sqlite3.IntegrityError:
-            # URL already exists
-            return False
-        finally:
-            conn.close()
+        return added
+            
+    def enqueue_many(self, items: List[Tuple[str, int, Optional[str]]]) -> int:
+        """
+        Add several URLs in a single transaction, skipping known ones.
+        
+        Args:
+            items: (url, depth, parent_url) tuples
+            
+        Returns:
+            Number of URLs that were newly added
+        """
+        if not items:
+            return 0
+            
+        created_at = _now_ms()
+        rows = []
+        for url, depth, parent_url in items:
+            canonical = canonicalize_url(url)
+            rows.append((
+                self._url_hash(url),
+                url,
+                canonical,
+                depth,
+                parent_url,
+                get_url_priority(canonical),
+                created_at
+            ))
+            
+        with self._lock:
+            before = self.conn.total_changes
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany("""
+                    INSERT OR IGNORE INTO urls (url_hash, url, canonical_url, depth, parent_url, priority, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            added = self.conn.total_changes - before
+            
+        logger.debug(f"Enqueued {added} of {len(rows)} URLs")
+        return added
             
     def dequeue(self) -> Optional[Tuple[str, int, str]]:
         """
@@ -99,99 +259,97 @@ class URLFrontier:
         Returns:
             (url, depth, url_hash) or None if queue is empty
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT canonical_url, depth, url_hash
-            FROM urls
-            WHERE status = 'pending' AND attempts < ?
-            ORDER BY priority DESC, created_at ASC
-            LIMIT 1
-        """, (config.max_retries,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
+        with self._lock:
+            if _HAS_RETURNING:
+                # Claim the next URL and mark it in-progress in one statement
+                rows = self.conn.execute(f"""
+                    UPDATE urls SET status = {_IN_PROGRESS}
+                    WHERE url_hash = (
+                        SELECT url_hash
+                        FROM urls
+                        WHERE status = {_PENDING} AND attempts < ?
+                        ORDER BY priority DESC, created_at ASC
+                        LIMIT 1
+                    )
+                    RETURNING canonical_url, depth, url_hash
+                """, (config.max_retries,)).fetchall()
+                result = rows[0] if rows else None
+            else:
+                self.conn.execute("BEGIN IMMEDIATE")
+                try:
+                    result = self.conn.execute(f"""
+                        SELECT canonical_url, depth, url_hash
+                        FROM urls
+                        WHERE status = {_PENDING} AND attempts < ?
+                        ORDER BY priority DESC, created_at ASC
+                        LIMIT 1
+                    """, (config.max_retries,)).fetchone()
+                    if result:
+                        # Mark as in-progress
+                        self.conn.execute(f"""
+                            UPDATE urls SET status = {_IN_PROGRESS} WHERE url_hash = ?
+                        """, (result[2],))
+                    self.conn.execute("COMMIT")
+                except BaseException:
+                    self.conn.execute("ROLLBACK")
+                    raise
+                    
         if result:
-            url, depth, url_hash = result
-            # Mark as in-progress
-            self._update_status(url_hash, "in_progress")
-            return (url, depth, url_hash)
+            return tuple(result)
         return None
         
     def mark_success(self, url_hash: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
         """Mark URL as successfully crawled."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE urls
-            SET status = 'success',
-                last_crawled = ?,
-                etag = ?,
-                last_modified = ?
-            WHERE url_hash = ?
-        """, (
-            datetime.utcnow().isoformat() + "Z",
-            etag,
-            last_modified,
-            url_hash
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self.conn.execute(f"""
+                UPDATE urls
+                SET status = {_SUCCESS},
+                    last_crawled = ?,
+                    etag = ?,
+                    last_modified = ?
+                WHERE url_hash = ?
+            """, (
+                _now_ms(),
+                etag,
+                last_modified,
+                url_hash
+            ))
         
     def mark_failure(self, url_hash: str, error_message: str):
         """Mark URL as failed and increment attempts."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE urls
-            SET status = 'failed',
-                attempts = attempts + 1,
-                error_message = ?,
-                last_crawled = ?
-            WHERE url_hash = ?
-        """, (
-            error_message,
-            datetime.utcnow().isoformat() + "Z",
-            url_hash
-        ))
-        
-        conn.commit()
-        conn.close()
-        
-    def _update_status(self, url_hash: str, status: str):
-        """Update URL status."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE urls SET status = ? WHERE url_hash = ?
-        """, (status, url_hash))
+        with self._lock:
+            self.conn.execute(f"""
+                UPDATE urls
+                SET status = {_FAILED},
+                    attempts = attempts + 1,
+                    error_message = ?,
+                    last_crawled = ?
+                WHERE url_hash = ?
+            """, (
+                error_message,
+                _now_ms(),
+                url_hash
+            ))
         
-        conn.commit()
-        conn.close()
+    def _update_status(self, url_hash: str, status: Status):
+        """Update URL status."""
+        with self._lock:
+            self.conn.execute("""
+                UPDATE urls SET status = ? WHERE url_hash = ?
+            """, (status, url_hash))
         
     def get_stats(self) -> dict:
         """Get frontier statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success,
-                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                SUM(CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END) as in_progress
-            FROM urls
-        """)
-        
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock:
+            row = self.conn.execute(f"""
+                SELECT 
+                    COUNT(*) as total,
+                    SUM(CASE WHEN status = {_PENDING} THEN 1 ELSE 0 END) as pending,
+                    SUM(CASE WHEN status = {_SUCCESS} THEN 1 ELSE 0 END) as success,
+                    SUM(CASE WHEN status = {_FAILED} THEN 1 ELSE 0 END) as failed,
+                    SUM(CASE WHEN status = {_IN_PROGRESS} THEN 1 ELSE 0 END) as in_progress
+                FROM urls
+            """).fetchone()
         
         return {
             "total": row[0],
@@ -203,16 +361,10 @@ class URLFrontier:
         
     def reset_in_progress(self):
         """Reset in-progress URLs to pending (for crash recovery)."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE urls SET status = 'pending' WHERE status = 'in_progress'
-        """)
-        
-        count = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self._lock:
+            count = self.conn.execute(f"""
+                UPDATE urls SET status = {_PENDING} WHERE status = {_IN_PROGRESS}
+            """).rowcount
         
         if count > 0:
             logger.info(f"Reset {count} in-progress URLs to pending")
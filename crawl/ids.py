@@ -0,0 +1,41 @@
+"""Stable identifiers for documents, entities and URLs."""
+import hashlib
+import xxhash
+from typing import Callable
+
+
+def make_id(*parts) -> str:
+    """
+    Build a deterministic ID from one or more parts.
+    
+    Parts are joined with "_" exactly as the former inline
+    f"{a}_{b}" strings were, so existing IDs are unchanged.
+    """
+    return hashlib.sha256("_".join(map(str, parts)).encode()).hexdigest()
+
+
+def id_maker(*prefix) -> Callable[..., str]:
+    """
+    Return a make_id with the leading parts bound.
+    
+    The shared prefix is hashed once; each call only hashes its own parts,
+    and make_id(*prefix, *parts) == id_maker(*prefix)(*parts).
+    """
+    base = hashlib.sha256(("_".join(map(str, prefix)) + "_").encode())
+    
+    def make(*parts) -> str:
+        h = base.copy()
+        h.update("_".join(map(str, parts)).encode())
+        return h.hexdigest()
+        
+    return make
+
+
+def url_key(canonical_url: str) -> str:
+    """
+    Build the frontier's lookup key for a canonical URL.
+    
+    The key is only used for de-duplication inside frontier.db, so it uses
+    the non-cryptographic 128-bit xxh3 rather than SHA-256.
+    """
+    return xxhash.xxh3_128_hexdigest(canonical_url.encode())
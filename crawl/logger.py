@@ -1,18 +1,53 @@
 """Structured logging for the crawler."""
 import logging
+import logging.handlers
 import json
+import atexit
+import copy
+import queue
+import time
+import functools
+from collections import deque
 from pathlib import Path
-from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from config import config
 
 
+# (second, formatted) for the last second utc_iso_now() formatted; swapped
+# as one tuple so threads never see a mismatched pair
+_utc_cache = (-1, "")
+
+
+def utc_iso_now(seconds: Optional[float] = None) -> str:
+    """
+    Return an ISO-8601 UTC timestamp with second precision.
+    
+    Args:
+        seconds: Unix time to format (default: now)
+    
+    The string is only rebuilt when the second changes, so bursts of log
+    records share one formatted value.
+    """
+    global _utc_cache
+    second = int(time.time() if seconds is None else seconds)
+    cached_second, text = _utc_cache
+    if second != cached_second:
+        text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _utc_cache = (second, text)
+    return text
+
+
 class JSONFormatter(logging.Formatter):
     """JSON log formatter."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dumps = functools.partial(json.dumps, separators=(",", ":"), default=str)
+        
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # Records may be formatted later on the listener thread
+            "timestamp": utc_iso_now(record.created),
             "level": record.levelname,
             "component": record.name,
             "message": record.getMessage(),
@@ -25,7 +60,57 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
             
-        return json.dumps(log_data)
+        return self._dumps(log_data)
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener's handlers."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args into the message now (they may change before the
+        # listener runs) but keep exc_info so JSONFormatter still emits
+        # the "exception" field
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# File output shared by every logger: records are queued on the caller's
+# thread and formatted/written by a single listener thread
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_handler = None
+_listener = None
+
+
+def _get_queue_handler() -> logging.Handler:
+    """Start the file log listener on first use and return its queue handler."""
+    global _queue_handler, _listener
+    if _queue_handler is not None:
+        return _queue_handler
+        
+    log_dir = config.output_dir / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    
+    file_handler = logging.FileHandler(log_dir / "crawler.log")
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(JSONFormatter())
+    
+    # Error file handler
+    error_handler = logging.FileHandler(log_dir / "errors.log")
+    error_handler.setLevel(logging.ERROR)
+    error_handler.setFormatter(JSONFormatter())
+    
+    _listener = logging.handlers.QueueListener(
+        _log_queue, file_handler, error_handler, respect_handler_level=True
+    )
+    _listener.start()
+    # Drain whatever is still queued before the interpreter exits
+    atexit.register(_listener.stop)
+    
+    _queue_handler = _RecordQueueHandler(_log_queue)
+    _queue_handler.setLevel(logging.DEBUG)
+    return _queue_handler
 
 
 def setup_logger(name: str) -> logging.Logger:
@@ -46,24 +131,16 @@ def setup_logger(name: str) -> logging.Logger:
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
     
-    # File handler (JSON)
-    log_dir = config.output_dir / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_handler = logging.FileHandler(log_dir / "crawler.log")
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(JSONFormatter())
-    logger.addHandler(file_handler)
-    
-    # Error file handler
-    error_handler = logging.FileHandler(log_dir / "errors.log")
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(JSONFormatter())
-    logger.addHandler(error_handler)
+    # File handlers (JSON), written off the caller's thread
+    logger.addHandler(_get_queue_handler())
     
     return logger
 
 
+# Most recent error records kept by MetricsLogger; older ones are dropped
+MAX_ERRORS = 1000
+
+
 class MetricsLogger:
     """Metrics tracking and logging."""
     
@@ -78,30 +155,38 @@ class MetricsLogger:
             "duplicates_filtered": 0,
             "total_crawl_time_seconds": 0,
             "avg_page_time_seconds": 0,
-            "errors": [],
+            "errors": deque(maxlen=MAX_ERRORS),
         }
         self.logger = setup_logger("metrics")
         
     def increment(self, metric: str, value: int = 1):
         """Increment a metric."""
-        if metric in self.metrics:
+        try:
             self.metrics[metric] += value
+        except KeyError:
+            # Unknown metrics are ignored
+            pass
             
     def add_error(self, url: str, error: str):
         """Add an error record."""
         self.metrics["errors"].append({
             "url": url,
             "error": error,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_iso_now()
         })
         
     def save(self):
         """Save metrics to file."""
         metrics_file = config.output_dir / "logs" / "metrics.json"
+        # Compact output; use errors_pretty() for a readable error list
         with open(metrics_file, "w") as f:
-            json.dump(self.metrics, f, indent=2)
+            json.dump({**self.metrics, "errors": list(self.metrics["errors"])}, f, separators=(",", ":"))
         self.logger.info(f"Metrics saved to {metrics_file}")
         
+    def errors_pretty(self) -> str:
+        """Return the recorded errors as indented JSON for reading."""
+        return json.dumps(list(self.metrics["errors"]), indent=2)
+        
     def get_summary(self) -> Dict[str, Any]:
         """Get metrics summary."""
         if self.metrics["pages_attempted"] > 0:
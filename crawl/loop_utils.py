@@ -0,0 +1,26 @@
+"""Event loop setup for the crawl entry points."""
+import asyncio
+import sys
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Make asyncio.run() use uvloop (winloop on Windows) when installed.
+    
+    Both are libuv-based drop-in loops with much lower per-callback
+    overhead than the default loop. Without them the default loop is
+    kept, so the crawler still runs.
+    
+    Returns:
+        True if a faster loop policy was installed
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return False
+        
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+    return True
@@ -3,14 +3,23 @@ import asyncio
 import argparse
 from pathlib import Path
 from frontier import URLFrontier
-from crawler import IndiaAICrawler
+from crawler import IndiaAICrawler, make_http_session
 from logger import setup_logger, metrics
 from config import config
+from url_utils import canonicalize_url
+from loop_utils import install_fast_event_loop
 
 
 logger = setup_logger("main")
 
 
+async def run_crawl(frontier: URLFrontier, max_pages: int):
+    """Crawl with one HTTP session shared for the whole run."""
+    async with make_http_session() as session:
+        crawler = IndiaAICrawler(frontier, http_session=session)
+        await crawler.crawl(max_pages=max_pages)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="IndiaAI Impact Crawler")
@@ -50,35 +59,31 @@ def main():
         frontier_db.unlink()
         logger.info("Cleared frontier database")
         
-    frontier = URLFrontier(frontier_db)
-    
-    # Enqueue seed URLs
-    for seed in args.seeds:
-        frontier.enqueue(seed, depth=0)
-        logger.info(f"Enqueued seed: {seed}")
+    with URLFrontier(frontier_db) as frontier:
+        # Enqueue seed URLs plus comprehensive high-value URLs from checklist,
+        # all in one transaction
+        from seeds import get_all_seeds
+        comprehensive_seeds = get_all_seeds()
         
-    # Add comprehensive high-value URLs from checklist
-    from seeds import get_all_seeds
-    comprehensive_seeds = get_all_seeds()
-    
-    for seed in comprehensive_seeds:
-        if frontier.enqueue(seed, depth=0):
-            logger.info(f"Enqueued comprehensive seed: {seed}")
+        # CLI and checklist seeds overlap; drop repeats (by canonical URL,
+        # keeping order) before they reach the database
+        all_seeds = [*args.seeds, *comprehensive_seeds]
+        unique_seeds = list(dict.fromkeys(map(canonicalize_url, all_seeds)))
+        added = frontier.enqueue_many([(seed, 0, None) for seed in unique_seeds])
+        logger.info(f"Enqueued {added} new of {len(unique_seeds)} unique seed URLs ({len(all_seeds)} given)")
+            
+        # Show frontier stats
+        stats = frontier.get_stats()
+        logger.info(f"Frontier stats: {stats}")
         
-    # Show frontier stats
-    stats = frontier.get_stats()
-    logger.info(f"Frontier stats: {stats}")
-    
-    # Create crawler
-    crawler = IndiaAICrawler(frontier)
-    
-    # Run crawl
-    logger.info(f"Starting crawl with max_pages={args.max_pages}")
-    asyncio.run(crawler.crawl(max_pages=args.max_pages))
-    
-    # Show final stats
-    final_stats = frontier.get_stats()
-    logger.info(f"Final frontier stats: {final_stats}")
+        # Run crawl
+        logger.info(f"Starting crawl with max_pages={args.max_pages}")
+        install_fast_event_loop()
+        asyncio.run(run_crawl(frontier, args.max_pages))
+        
+        # Show final stats
+        final_stats = frontier.get_stats()
+        logger.info(f"Final frontier stats: {final_stats}")
     
     metrics_summary = metrics.get_summary()
     logger.info(f"Crawl metrics: {metrics_summary}")
@@ -137,6 +137,7 @@ class Chunk(BaseModel):
     entity_type: Optional[str] = None
     working_group: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    content_fingerprint: int = Field(default=0, exclude=True)  # dedup hash, not exported
 
 
 class CrawlResult(BaseModel):
@@ -1,4 +1,8 @@
 """Section-based crawl configuration for IndiaAI Impact website."""
+import functools
+import re
+from urllib.parse import urlsplit
+
 
 # Define all website sections/badges
 SECTIONS = {
@@ -96,6 +100,40 @@ SECTIONS = {
 }
 
 
+# Section-specific URL patterns, matched anywhere in the lowercased path
+SECTION_URL_PATTERNS = {
+    "agenda": ["/agenda"],
+    "working_groups": ["/working-groups"],
+    "events_challenges": [
+        "/events/ai-for-all",
+        "/events/ai-by-her", 
+        "/events/yuvai",
+        "/events/aboutthechallenge"
+    ],
+    "events_casebook": [
+        "/events/casebook"
+    ],
+    "pre_summit_events": [
+        "/home/pre-summit-events",
+        "/home/host-pre-summit-events",
+        "/home/main-summit-events"
+    ],
+    "about_info": [
+        "/about-summit",
+        "/contact-us"
+    ],
+    "pdfs_documents": [
+        ".pdf"
+    ],
+}
+
+# One alternation per section, so each check is a single regex search
+_SECTION_URL_RES = {
+    section_id: re.compile("|".join(map(re.escape, patterns)))
+    for section_id, patterns in SECTION_URL_PATTERNS.items()
+}
+
+
 def get_section(section_id):
     """Get section configuration by ID."""
     return SECTIONS.get(section_id)
@@ -118,6 +156,8 @@ def get_section_max_pages(section_id):
     return section["max_pages"] if section else 10
 
 
+# Nav links repeat on every page, so section checks are memoized
+@functools.lru_cache(maxsize=100_000)
 def url_matches_section(url, section_id):
     """
     Check if a URL belongs to a specific section.
@@ -129,47 +169,12 @@ def url_matches_section(url, section_id):
     Returns:
         True if URL matches section patterns, False otherwise
     """
-    from urllib.parse import urlparse
-    
-    path = urlparse(url).path.lower()
-    
-    # Section-specific URL patterns
-    patterns = {
-        "agenda": ["/agenda"],
-        "working_groups": ["/working-groups"],
-        "events_challenges": [
-            "/events/ai-for-all",
-            "/events/ai-by-her", 
-            "/events/yuvai",
-            "/events/aboutthechallenge"
-        ],
-        "events_casebook": [
-            "/events/casebook"
-        ],
-        "pre_summit_events": [
-            "/home/pre-summit-events",
-            "/home/host-pre-summit-events",
-            "/home/main-summit-events"
-        ],
-        "about_info": [
-            "/about-summit",
-            "/contact-us"
-        ],
-        "pdfs_documents": [
-            ".pdf"
-        ],
-    }
-    
-    # Get patterns for this section
-    section_patterns = patterns.get(section_id, [])
+    path = urlsplit(url).path.lower()
     
     # Special case: homepage belongs to about_info
     if section_id == "about_info" and path in ["/", ""]:
         return True
     
     # Check if URL matches any pattern for this section
-    for pattern in section_patterns:
-        if pattern in path:
-            return True
-    
-    return False
+    section_re = _SECTION_URL_RES.get(section_id)
+    return bool(section_re and section_re.search(path))
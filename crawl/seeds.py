@@ -4,7 +4,7 @@
 BASE_URL = "https://impact.indiaai.gov.in"
 
 # Comprehensive seed list based on checklist
-SEED_URLS = [
+SEED_URLS = (
     # Homepage
     f"{BASE_URL}",
     
@@ -49,7 +49,7 @@ SEED_URLS = [
     
     # Expo subdomain (if accessible)
     "https://impactexpo.indiaai.gov.in",
-]
+)
 
 # Additional patterns to discover
 URL_PATTERNS = [
@@ -14,7 +14,8 @@ if sys.platform == "win32":
 from frontier import URLFrontier
 from crawler import IndiaAICrawler
 from config import config
-import json
+from loop_utils import install_fast_event_loop
+import orjson
 
 
 def crawl_url_simple(url: str, section_name: str):
@@ -33,17 +34,20 @@ def crawl_url_simple(url: str, section_name: str):
     if frontier_db.exists():
         frontier_db.unlink()
     
-    frontier = URLFrontier(frontier_db)
-    frontier.enqueue(url, depth=0)
-    crawler = IndiaAICrawler(frontier)
-    
-    asyncio.run(crawler.crawl(max_pages=1))
+    with URLFrontier(frontier_db) as frontier:
+        frontier.enqueue(url, depth=0)
+        crawler = IndiaAICrawler(frontier)
+        
+        install_fast_event_loop()
+        asyncio.run(crawler.crawl(max_pages=1))
     
     # Export all documents
     docs = []
-    for doc_file in (output_dir / "documents").glob("*.json"):
-        with open(doc_file, 'r', encoding='utf-8') as f:
-            docs.append(json.load(f))
+    with os.scandir(output_dir / "documents") as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                with open(entry.path, "rb") as f:
+                    docs.append(orjson.loads(f.read()))
     
     # Save
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -53,8 +57,11 @@ def crawl_url_simple(url: str, section_name: str):
     filename = f"{section_name}_{url_slug}_{timestamp}.json"
     output_file = output_dir / filename
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({"documents": docs, "url": url, "timestamp": timestamp}, f, indent=2, ensure_ascii=False)
+    # orjson writes UTF-8 directly, like ensure_ascii=False did
+    output_file.write_bytes(orjson.dumps(
+        {"documents": docs, "url": url, "timestamp": timestamp},
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ))
     
     print(f"\n✓ Saved: {filename}\n")
     return output_file
@@ -0,0 +1,43 @@
+"""HTML parsing helpers."""
+from bs4 import BeautifulSoup, FeatureNotFound
+from lxml import etree
+from lxml import html as lxml_html
+
+
+# lxml is several times faster than the pure-Python "html.parser"
+HTML_PARSER = "lxml"
+
+# Text nodes under an element, skipping the same non-content tags that
+# BeautifulSoup.get_text() leaves out
+_TEXT_XPATH = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """Parse HTML into a BeautifulSoup tree using the configured parser."""
+    try:
+        return BeautifulSoup(html, HTML_PARSER)
+    except FeatureNotFound:
+        # lxml missing from the environment; stay functional, just slower
+        return BeautifulSoup(html, "html.parser")
+
+
+def make_tree(html: str) -> lxml_html.HtmlElement:
+    """Parse HTML into a bare lxml document tree (much cheaper than a soup)."""
+    if not html or not html.strip():
+        # lxml refuses empty documents
+        return lxml_html.document_fromstring("<html></html>")
+    try:
+        try:
+            return lxml_html.document_fromstring(html)
+        except ValueError:
+            # str input with an XML encoding declaration (e.g. XHTML) is
+            # only accepted as bytes
+            return lxml_html.document_fromstring(html.encode("utf-8"))
+    except (ValueError, etree.ParserError):
+        # Nothing parseable, e.g. only a comment or doctype
+        return lxml_html.document_fromstring("<html></html>")
+
+
+def element_text(element: lxml_html.HtmlElement, separator: str = "") -> str:
+    """Return an element's text like BeautifulSoup's get_text(separator, strip=True)."""
+    return separator.join(text for text in map(str.strip, _TEXT_XPATH(element)) if text)
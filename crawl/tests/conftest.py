@@ -0,0 +1,5 @@
+"""Make the crawl modules importable the way the scripts import them."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,42 @@
+"""Tests for the crawler's per-host request pacing."""
+import asyncio
+
+from crawler import _HostLimiter
+
+
+def _run(limiter, urls, hold=0.0):
+    """Enter a slot for each URL concurrently; return (start times, peak concurrency)."""
+    starts = []
+    active = peak = 0
+
+    async def request(url):
+        nonlocal active, peak
+        async with limiter.slot(url):
+            starts.append((url, asyncio.get_running_loop().time()))
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(hold)
+            active -= 1
+
+    async def main():
+        t0 = asyncio.get_running_loop().time()
+        await asyncio.gather(*(request(url) for url in urls))
+        return [(url, t - t0) for url, t in starts]
+
+    return asyncio.run(main()), peak
+
+
+def test_requests_to_one_host_are_spaced():
+    starts, _ = _run(_HostLimiter(5, 0.05), ["https://a/1", "https://a/2", "https://a/3"])
+    times = sorted(t for _, t in starts)
+    assert all(b - a >= 0.045 for a, b in zip(times, times[1:]))
+
+
+def test_hosts_are_paced_independently():
+    starts, _ = _run(_HostLimiter(5, 0.2), ["https://a/1", "https://b/1"])
+    assert all(t < 0.1 for _, t in starts)
+
+
+def test_concurrency_per_host_is_capped():
+    _, peak = _run(_HostLimiter(2, 0.0), [f"https://a/{i}" for i in range(6)], hold=0.02)
+    assert peak == 2
@@ -0,0 +1,45 @@
+"""Tests for the PDF downloader's retry behaviour."""
+import asyncio
+
+import aiohttp
+from aiohttp import web
+
+from config import config
+from download_pdfs import _download_one
+
+
+def _count_hits(status: int, tmp_path) -> int:
+    """Download from a server that always answers with `status`; return how often it was hit."""
+    hits = 0
+
+    async def handler(request):
+        nonlocal hits
+        hits += 1
+        return web.Response(status=status)
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/doc.pdf", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        port = runner.addresses[0][1]
+        try:
+            async with aiohttp.ClientSession() as session:
+                saved = await _download_one(session, asyncio.Semaphore(1), f"http://127.0.0.1:{port}/doc.pdf", tmp_path)
+        finally:
+            await runner.cleanup()
+        assert saved is False
+
+    asyncio.run(run())
+    return hits
+
+
+def test_client_error_is_not_retried(tmp_path):
+    assert _count_hits(404, tmp_path) == 1
+
+
+def test_server_error_is_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "max_retries", 3)
+    monkeypatch.setattr(config, "retry_backoff_factor", 0.01)
+    assert _count_hits(503, tmp_path) == 3
@@ -0,0 +1,35 @@
+"""Tests for the frontier JSON export."""
+import sqlite3
+
+import orjson
+
+from export_frontier import export_frontier_to_json
+
+
+def test_export_migrates_baseline_schema(tmp_path):
+    db_path = tmp_path / "frontier.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE urls (
+            url_hash TEXT PRIMARY KEY, url TEXT NOT NULL, canonical_url TEXT NOT NULL,
+            depth INTEGER NOT NULL, parent_url TEXT, priority INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,
+            last_crawled TEXT, etag TEXT, last_modified TEXT, error_message TEXT,
+            created_at TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        INSERT INTO urls VALUES ('h', 'https://a/', 'https://a/', 0, NULL, 5, 'success', 1,
+            '2026-01-02T03:04:05.678Z', NULL, NULL, NULL, '2026-01-01T00:00:00.000Z')
+    """)
+    conn.commit()
+    conn.close()
+
+    output_path = export_frontier_to_json(db_path, tmp_path / "export.json")
+    export = orjson.loads(output_path.read_bytes())
+
+    assert export["statistics"]["success"] == 1
+    [row] = export["urls"]
+    assert row["status"] == "success"
+    assert row["last_crawled"] == "2026-01-02T03:04:05.678Z"
+    assert row["created_at"] == "2026-01-01T00:00:00.000Z"
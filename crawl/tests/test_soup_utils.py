@@ -0,0 +1,20 @@
+"""Tests for the HTML parsing helpers."""
+from soup_utils import make_tree
+
+
+def test_make_tree_accepts_xml_encoding_declaration():
+    html = '<?xml version="1.0" encoding="utf-8"?><html><body><a href="/x">x</a></body></html>'
+    tree = make_tree(html)
+    assert tree.xpath("//a/@href") == ["/x"]
+
+
+def test_make_tree_comment_only_returns_empty_document():
+    tree = make_tree("<!-- c -->")
+    assert tree.tag == "html"
+    assert tree.xpath("//a") == []
+
+
+def test_make_tree_doctype_only_returns_empty_document():
+    tree = make_tree("<!DOCTYPE html>")
+    assert tree.tag == "html"
+    assert tree.xpath("//a") == []
@@ -0,0 +1,9 @@
+"""Tests for URL classification."""
+from models import ContentType
+from url_utils import classify_url, get_url_priority
+
+
+def test_overlapping_path_keywords_are_all_found():
+    url = "https://impact.indiaai.gov.in/mediagenda"
+    assert classify_url(url) == ContentType.AGENDA_ITEM
+    assert get_url_priority(url) == 10
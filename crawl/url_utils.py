@@ -1,12 +1,33 @@
 """URL utilities for normalization, classification, and link extraction."""
-from urllib.parse import urlparse, urljoin, parse_qs, urlunparse
+import functools
+from urllib.parse import urlparse, urljoin, unquote, urlunparse
 from typing import List, Tuple, Optional
 import re
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from soup_utils import make_tree, element_text
 from models import ContentType
 from config import config
 
 
+# Nav/footer links repeat on every page, so the pure URL helpers are memoized
+_URL_CACHE_SIZE = 100_000
+
+# Query parameters dropped during canonicalization
+_TRACKING_PARAMS = frozenset({"utm_source", "utm_medium", "utm_campaign", "utm_content", "utm_term"})
+
+# Link schemes that never carry a host, so can never be in scope
+_NO_HOST_SCHEMES = ("javascript:", "mailto:", "tel:", "data:")
+
+# Path keywords that drive URL classification and priority
+_PATH_KEYWORDS = ("agenda", "working-group", "event", "media", "news", "announcement")
+
+# Link text keywords per class, checked in this order
+_REGISTRATION_TEXT_RE = re.compile(r"register|registration|sign up|rsvp", re.IGNORECASE)
+_EOI_TEXT_RE = re.compile(r"eoi|expression of interest|apply", re.IGNORECASE)
+_DOWNLOAD_TEXT_RE = re.compile(r"download|pdf|brochure|guide", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
 def canonicalize_url(url: str) -> str:
     """
     Canonicalize URL by:
@@ -15,46 +36,82 @@ def canonicalize_url(url: str) -> str:
     - Normalizing trailing slash
     - Removing fragment
     """
-    parsed = urlparse(url)
+    scheme, netloc, path, params, query, _ = urlparse(url)
     
     # Lowercase domain
-    netloc = parsed.netloc.lower()
+    netloc = netloc.lower()
     
     # Remove tracking parameters
-    query_params = parse_qs(parsed.query)
-    tracking_params = {"utm_source", "utm_medium", "utm_campaign", "utm_content", "utm_term"}
-    clean_params = {k: v for k, v in query_params.items() if k not in tracking_params}
-    
-    # Rebuild query string
-    query_string = "&".join(f"{k}={v[0]}" for k, v in clean_params.items())
+    if query:
+        query = _clean_query(query)
     
     # Normalize path (remove trailing slash unless it's root)
-    path = parsed.path.rstrip("/") if parsed.path != "/" else "/"
+    if path != "/":
+        path = path.rstrip("/")
     
-    # Rebuild URL without fragment
-    canonical = urlunparse((
-        parsed.scheme,
-        netloc,
-        path,
-        parsed.params,
-        query_string,
-        ""  # No fragment
-    ))
+    if params or not (scheme and netloc):
+        # Unusual shapes keep urlunparse's handling
+        return urlunparse((scheme, netloc, path, params, query, ""))
+        
+    # Rebuild URL without fragment; with a host present this is exactly
+    # what urlunparse would produce
+    if query:
+        return f"{scheme}://{netloc}{path}?{query}"
+    return f"{scheme}://{netloc}{path}"
+
+
+def _clean_query(query: str) -> str:
+    """
+    Drop tracking parameters from a query string.
     
-    return canonical
+    Matches the former parse_qs round trip: blank values are dropped,
+    names and values are decoded, and only a name's first value is kept.
+    """
+    params = {}
+    for field in query.split("&"):
+        name, _, value = field.partition("=")
+        if not value:
+            continue
+        name = unquote(name.replace("+", " "))
+        if name in _TRACKING_PARAMS or name in params:
+            continue
+        params[name] = unquote(value.replace("+", " "))
+    return "&".join(f"{name}={value}" for name, value in params.items())
 
 
 def is_in_scope(url: str) -> bool:
     """Check if URL is within allowed domain."""
-    parsed = urlparse(url)
-    return parsed.netloc.lower() == config.allowed_domain.lower()
+    # allowed_domain can be changed at runtime, so it is part of the key
+    return _in_scope(url, config.allowed_domain)
+
 
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
+def _in_scope(url: str, allowed_domain: str) -> bool:
+    """Cached worker for is_in_scope."""
+    return urlparse(url).netloc.lower() == allowed_domain.lower()
 
+
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
 def is_pdf(url: str) -> bool:
     """Check if URL points to a PDF."""
     return url.lower().endswith(".pdf")
 
 
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
+def _path_keywords(url: str) -> frozenset:
+    """
+    Return the classification keywords present in the URL's path.
+    
+    classify_url and get_url_priority both read this, so each URL's path
+    is parsed and scanned once. Each keyword gets its own substring test:
+    keywords can overlap (e.g. "mediagenda"), which a single regex pass
+    would miss.
+    """
+    path = urlparse(url).path.lower()
+    return frozenset(keyword for keyword in _PATH_KEYWORDS if keyword in path)
+
+
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
 def classify_url(url: str) -> ContentType:
     """
     Classify URL based on path patterns.
@@ -66,23 +123,24 @@ def classify_url(url: str) -> ContentType:
     4. media -> NEWS
     5. Default -> GENERIC_PAGE
     """
-    path = urlparse(url).path.lower()
+    keywords = _path_keywords(url)
     
-    if "agenda" in path:
+    if "agenda" in keywords:
         return ContentType.AGENDA_ITEM
-    elif "working-group" in path:
+    elif "working-group" in keywords:
         return ContentType.WORKING_GROUP_PAGE
-    elif "event" in path:
+    elif "event" in keywords:
         if is_pdf(url):
             # Will be further classified during extraction
             return ContentType.EXHIBITION
         return ContentType.EVENT
-    elif "media" in path or "news" in path or "announcement" in path:
+    elif "media" in keywords or "news" in keywords or "announcement" in keywords:
         return ContentType.NEWS
     else:
         return ContentType.GENERIC_PAGE
 
 
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
 def get_url_priority(url: str) -> int:
     """
     Calculate URL priority for crawl queue.
@@ -95,17 +153,17 @@ def get_url_priority(url: str) -> int:
     - media: 6
     - other: 5
     """
-    path = urlparse(url).path.lower()
+    keywords = _path_keywords(url)
     
-    if "agenda" in path:
+    if "agenda" in keywords:
         return 10
-    elif "working-group" in path:
+    elif "working-group" in keywords:
         return 9
-    elif "event" in path:
+    elif "event" in keywords:
         return 8
     elif is_pdf(url):
         return 7
-    elif "media" in path or "news" in path:
+    elif "media" in keywords or "news" in keywords:
         return 6
     else:
         return 5
@@ -118,18 +176,35 @@ def extract_links(html: str, base_url: str) -> List[Tuple[str, str]]:
     Returns:
         List of (absolute_url, link_text) tuples
     """
-    soup = BeautifulSoup(html, "html.parser")
+    return extract_links_from_tree(make_tree(html), base_url)
+
+
+def extract_links_from_tree(tree: lxml_html.HtmlElement, base_url: str) -> List[Tuple[str, str]]:
+    """
+    Extract all links from an already-parsed lxml tree.
+    
+    Returns:
+        List of (absolute_url, link_text) tuples
+    """
     links = []
     
-    for anchor in soup.find_all("a", href=True):
-        href = anchor["href"]
-        text = anchor.get_text(strip=True)
+    for anchor in tree.iterfind(".//a[@href]"):
+        href = anchor.get("href")
         
+        # Cheap screen before joining and parsing
+        if href.lstrip()[:11].lower().startswith(_NO_HOST_SCHEMES):
+            continue
+            
         # Convert to absolute URL
         absolute_url = urljoin(base_url, href)
         
         # Only include in-scope links
         if is_in_scope(absolute_url):
+            # Most anchors hold bare text, which needs no subtree walk
+            if len(anchor):
+                text = element_text(anchor)
+            else:
+                text = anchor.text.strip() if anchor.text else ""
             links.append((absolute_url, text))
     
     return links
@@ -141,13 +216,13 @@ def classify_link_text(text: str) -> str:
     
     Returns: registration, eoi, download, or navigation
     """
-    text_lower = text.lower()
-    
-    if any(keyword in text_lower for keyword in ["register", "registration", "sign up", "rsvp"]):
+    # One pattern per class rather than a single alternation, which would
+    # pick the leftmost keyword instead of the highest-ranked class
+    if _REGISTRATION_TEXT_RE.search(text):
         return "registration"
-    elif any(keyword in text_lower for keyword in ["eoi", "expression of interest", "apply"]):
+    elif _EOI_TEXT_RE.search(text):
         return "eoi"
-    elif any(keyword in text_lower for keyword in ["download", "pdf", "brochure", "guide"]):
+    elif _DOWNLOAD_TEXT_RE.search(text):
         return "download"
     else:
         return "navigation"
@@ -159,17 +234,16 @@ def extract_section_path(url: str) -> List[str]:
     
     Example: /working-groups/safe-trusted-ai -> ["Working Groups", "Safe & Trusted AI"]
     """
+    # Fresh list per call so callers can't mutate the cached value
+    return list(_section_path(url))
+
+
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
+def _section_path(url: str) -> Tuple[str, ...]:
+    """Cached worker for extract_section_path."""
     path = urlparse(url).path.strip("/")
     if not path:
-        return []
-    
-    segments = path.split("/")
-    
-    # Clean and title-case segments
-    section_path = []
-    for segment in segments:
-        # Replace hyphens with spaces and title case
-        cleaned = segment.replace("-", " ").title()
-        section_path.append(cleaned)
+        return ()
     
-    return section_path
+    # Replace hyphens with spaces and title case each segment
+    return tuple(segment.replace("-", " ").title() for segment in path.split("/"))
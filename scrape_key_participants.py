@@ -13,16 +13,44 @@ if sys.platform == "win32":
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
 import asyncio
-import json
 import aiohttp
+import orjson
 from pathlib import Path
-from datetime import datetime
+from typing import Optional
+from datetime import datetime, timezone
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
-from bs4 import BeautifulSoup
+from lxml import etree, html as lhtml
 from urllib.parse import urljoin
+from tqdm import tqdm
 import hashlib
 
 
+def _has_class(name: str) -> str:
+    """XPath test for an element whose class list includes `name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Participant card queries, compiled once.
+# Cards are the grid divs holding both a name and an image
+_NAME = f".//span[{_has_class('tw:typography-headline-4')}]"
+_IMAGE = f".//img[{_has_class('tw:object-cover')}]"
+CARD_XPATH = etree.XPath(f"//div[{_has_class('tw:grid')}]//div[{_NAME} and {_IMAGE}]")
+NAME_XPATH = etree.XPath(_NAME)
+IMAGE_XPATH = etree.XPath(_IMAGE)
+TITLE_ORG_XPATH = etree.XPath(f".//div[{_has_class('tw:text-grey-400')} and {_has_class('tw:text-sm')}]")
+
+# Concurrency cap for participant image downloads
+MAX_CONCURRENT_IMAGES = 32
+MAX_IMAGES_PER_HOST = 16
+IMAGE_KEEPALIVE_SECONDS = 60
+IMAGE_CHUNK_SIZE = 64 * 1024
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.gif'})
+IMAGE_SNIFF_BYTES = 12
+
+# Maps every ASCII character that can't appear in a filename (spaces included) to "_"
+_SAFE_NAME_TABLE = str.maketrans({c: '_' for c in map(chr, range(128)) if not (c.isalnum() or c in '-_')})
+
+
 async def scrape_key_participants():
     """Scrape all key participants from the homepage."""
     url = "https://impact.indiaai.gov.in/"
@@ -38,8 +66,8 @@ async def scrape_key_participants():
     
     # Configure browser
     browser_config = BrowserConfig(
-        headless=False,
-        verbose=True,
+        headless=True,
+        verbose=False,
         viewport_width=1920,
         viewport_height=1080,
     )
@@ -48,25 +76,37 @@ async def scrape_key_participants():
     crawler_config = CrawlerRunConfig(
         cache_mode=CacheMode.BYPASS,
         page_timeout=120000,  # 120 seconds
-        wait_until="domcontentloaded",  # Less strict than networkidle
+        wait_until="commit",  # The script below waits for the elements it needs
         js_code=[
-            # Wait for page to load and click "View All"
+            # Wait for the first cards, then click "View All" if it shows up and
+            # wait for the extra cards
             """
-            await new Promise(r => setTimeout(r, 3000));
-            const viewAllBtn = Array.from(document.querySelectorAll('button')).find(el => 
+            const waitFor = async (fn, timeout = 10000) => {
+                const start = Date.now();
+                while (!fn()) {
+                    if (Date.now() - start > timeout) return false;
+                    await new Promise(r => setTimeout(r, 50));
+                }
+                return true;
+            };
+            const findViewAll = () => Array.from(document.querySelectorAll('button')).find(el => 
                 el.textContent.includes('View All')
             );
+            const countCards = () => document.querySelectorAll('span.tw\\\\:typography-headline-4').length;
+            
+            // Navigation returns at commit, so the cards are always waited for
+            await waitFor(() => countCards() > 0);
+            await waitFor(findViewAll);
+            const viewAllBtn = findViewAll();
             if (viewAllBtn) {
+                const before = countCards();
                 viewAllBtn.click();
-                await new Promise(r => setTimeout(r, 3000));
+                await waitFor(() => countCards() > before);
             }
             """,
         ],
-        delay_before_return_html=2.0,
     )
     
-    participants = []
-    
     async with AsyncWebCrawler(config=browser_config) as crawler:
         print("Crawling page...")
         result = await crawler.arun(url=url, config=crawler_config)
@@ -74,92 +114,33 @@ async def scrape_key_participants():
         if not result.success:
             print(f"Error: {result.error_message}")
             return
-        
-        print("Parsing HTML...")
-        soup = BeautifulSoup(result.html, "html.parser")
-        
-        # Find all participant cards using the grid container
-        # After "View All" is clicked, participants are in a grid
-        participant_cards = soup.select("div.tw\\:grid div")
-        
-        # Filter to actual participant cards (those with images and names)
-        actual_cards = []
-        for card in participant_cards:
-            name_elem = card.select_one("span.tw\\:typography-headline-4")
-            img_elem = card.select_one("img.tw\\:object-cover")
-            if name_elem and img_elem:
-                actual_cards.append(card)
-        
-        print(f"Found {len(actual_cards)} participant cards")
-        
-        # Extract data from each card
-        for idx, card in enumerate(actual_cards, 1):
-            try:
-                # Extract name
-                name_elem = card.select_one("span.tw\\:typography-headline-4")
-                name = name_elem.get_text(strip=True) if name_elem else "Unknown"
-                
-                # Extract title and organization (combined in one element)
-                title_org_elem = card.select_one("div.tw\\:text-grey-400.tw\\:text-sm")
-                title_org = title_org_elem.get_text(strip=True) if title_org_elem else ""
-                
-                # Try to split title and organization
-                # Format is usually: "Title, Organization"
-                if ", " in title_org:
-                    parts = title_org.rsplit(", ", 1)
-                    title = parts[0].strip()
-                    organization = parts[1].strip() if len(parts) > 1 else ""
-                else:
-                    title = title_org
-                    organization = ""
-                
-                # Extract image URL
-                img_elem = card.select_one("img.tw\\:object-cover")
-                img_url = img_elem.get("src") if img_elem else None
-                
-                # Make image URL absolute
-                if img_url:
-                    img_url = urljoin(url, img_url)
-                
-                participant = {
-                    "id": idx,
-                    "name": name,
-                    "title": title,
-                    "organization": organization,
-                    "image_url": img_url,
-                    "image_filename": None,
-                }
-                
-                # Download image
-                if img_url:
-                    try:
-                        image_filename = await download_image(img_url, images_dir, name)
-                        participant["image_filename"] = image_filename
-                        print(f"  [{idx}/{len(actual_cards)}] {name} - Image downloaded")
-                    except Exception as e:
-                        print(f"  [{idx}/{len(actual_cards)}] {name} - Image download failed: {e}")
-                else:
-                    print(f"  [{idx}/{len(actual_cards)}] {name} - No image URL")
-                
-                participants.append(participant)
-                
-            except Exception as e:
-                print(f"Error extracting participant {idx}: {e}")
-                continue
+    
+    print("Parsing HTML...")
+    participants = extract_participants(result.html, url)
+    
+    # Download all images concurrently over one shared session
+    # Photos mostly come from one CDN host, so a few kept-alive connections
+    # are reused rather than a TLS handshake per image
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_IMAGES,
+        limit_per_host=MAX_IMAGES_PER_HOST,
+        keepalive_timeout=IMAGE_KEEPALIVE_SECONDS,
+        ssl=False,
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await download_all(participants, images_dir, session)
     
     # Save JSON
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     json_file = output_dir / f"key_participants_{timestamp}.json"
     
-    output_data = {
-        "scraped_at": datetime.utcnow().isoformat() + "Z",
+    header = {
+        "scraped_at": datetime.now(timezone.utc),
         "source_url": url,
         "total_participants": len(participants),
-        "participants": participants,
     }
     
-    with open(json_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    write_participants_json(json_file, header, participants)
     
     print(f"\n{'='*60}")
     print(f"✓ Scraping complete!")
@@ -171,30 +152,194 @@ async def scrape_key_participants():
     return json_file
 
 
-async def download_image(url: str, images_dir: Path, participant_name: str) -> str:
+def write_participants_json(json_file: Path, header: dict, participants: list):
+    """Write the header fields and participants one at a time, as an indented JSON object."""
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    
+    with open(json_file, "wb") as f:
+        f.write(b"{\n")
+        for key, value in header.items():
+            f.write(b"  " + orjson.dumps(key) + b": " + orjson.dumps(value, option=option) + b",\n")
+        
+        if not participants:
+            f.write(b'  "participants": []\n}')
+            return
+        
+        # Each participant is nested two levels deep, so its lines get four spaces
+        f.write(b'  "participants": [\n')
+        for idx, participant in enumerate(participants):
+            if idx:
+                f.write(b",\n")
+            f.write(b"    " + orjson.dumps(participant, option=option).replace(b"\n", b"\n    "))
+        f.write(b"\n  ]\n}")
+
+
+def _element_text(element) -> str:
+    """Join an element's stripped text nodes, like BeautifulSoup's get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+def extract_participants(html: str, base_url: str) -> list:
+    """Extract participant details from the page HTML."""
+    try:
+        try:
+            tree = lhtml.fromstring(html)
+        except ValueError:
+            # str input with an XML encoding declaration is only accepted as bytes
+            tree = lhtml.fromstring(html.encode("utf-8"))
+    except (ValueError, etree.ParserError):
+        # Empty page (or only a comment/doctype): nothing to extract
+        print("Found 0 participant cards")
+        return []
+    
+    # Find all participant cards (with images and names) in the grid container
+    # After "View All" is clicked, participants are in a grid
+    actual_cards = CARD_XPATH(tree)
+    
+    print(f"Found {len(actual_cards)} participant cards")
+    
+    # Extract data from each card
+    participants = []
+    for idx, card in enumerate(actual_cards, 1):
+        try:
+            # Extract name
+            name = _element_text(NAME_XPATH(card)[0])
+            
+            # Extract title and organization (combined in one element)
+            title_org_elems = TITLE_ORG_XPATH(card)
+            title_org = _element_text(title_org_elems[0]) if title_org_elems else ""
+            
+            # Try to split title and organization
+            # Format is usually: "Title, Organization"
+            if ", " in title_org:
+                parts = title_org.rsplit(", ", 1)
+                title = parts[0].strip()
+                organization = parts[1].strip() if len(parts) > 1 else ""
+            else:
+                title = title_org
+                organization = ""
+            
+            # Extract image URL
+            img_url = IMAGE_XPATH(card)[0].get("src")
+            
+            # Make image URL absolute
+            if img_url and not img_url.startswith(("http://", "https://")):
+                img_url = urljoin(base_url, img_url)
+            
+            participant = {
+                "id": idx,
+                "name": name,
+                "title": title,
+                "organization": organization,
+                "image_url": img_url,
+                "image_filename": None,
+            }
+            
+            participants.append(participant)
+            
+        except Exception as e:
+            print(f"Error extracting participant {idx}: {e}")
+            continue
+    
+    return participants
+
+
+async def download_all(participants: list, images_dir: Path, session: aiohttp.ClientSession):
+    """Download every participant's image concurrently."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGES)
+    
+    # One progress bar instead of a console line per image; only problems are printed
+    with tqdm(total=len(participants), desc="Images", unit="img") as progress:
+        await asyncio.gather(*(
+            _download_participant_image(session, semaphore, participant, images_dir, progress)
+            for participant in participants
+        ))
+
+
+async def _download_participant_image(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, participant: dict, images_dir: Path, progress: tqdm):
+    """Download one participant's image and record its filename."""
+    idx, name, img_url = participant["id"], participant["name"], participant["image_url"]
+    
+    if not img_url:
+        tqdm.write(f"  [{idx}] {name} - No image URL")
+        progress.update(1)
+        return
+    
+    async with semaphore:
+        try:
+            participant["image_filename"] = await download_image(img_url, images_dir, name, session)
+        except Exception as e:
+            tqdm.write(f"  [{idx}] {name} - Image download failed: {e}")
+        finally:
+            progress.update(1)
+
+
+def _sniff_image_ext(header: bytes) -> Optional[str]:
+    """Identify the image format from its leading magic bytes."""
+    if header.startswith(b"\x89PNG"):
+        return '.png'
+    if header.startswith(b"\xff\xd8\xff"):
+        return '.jpg'
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return '.webp'
+    if header.startswith(b"GIF8"):
+        return '.gif'
+    return None
+
+
+async def download_image(url: str, images_dir: Path, participant_name: str, session: aiohttp.ClientSession) -> str:
     """Download an image and save it locally."""
     # Create a safe filename from participant name
-    safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in participant_name)
-    safe_name = safe_name.replace(' ', '_').lower()
+    safe_name = participant_name.translate(_SAFE_NAME_TABLE)
+    if not safe_name.isascii():
+        safe_name = "".join(c if c.isascii() or c.isalnum() else '_' for c in safe_name)
+    safe_name = safe_name.lower()
     
-    # Get file extension from URL
-    ext = Path(url).suffix
-    if not ext or ext not in ['.jpg', '.jpeg', '.png', '.webp', '.gif']:
+    # Get file extension from URL; the downloaded bytes have the final say
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    dot = path.rfind('.')
+    ext = path[dot:].lower() if dot >= 0 else ''
+    if ext not in IMAGE_EXTENSIONS:
         ext = '.jpg'
     
-    filename = f"{safe_name}{ext}"
-    filepath = images_dir / filename
+    # A short URL hash keeps participants with the same name from colliding
+    url_hash = hashlib.sha1(url.encode()).hexdigest()[:12]
+    stem = f"{safe_name}_{url_hash}"
+    
+    # Skip images already saved by an earlier run, if the size still matches
+    existing = next((p for p in (images_dir / f"{stem}{e}" for e in IMAGE_EXTENSIONS) if p.exists()), None)
+    if existing:
+        try:
+            async with session.head(url, allow_redirects=True) as response:
+                content_length = response.headers.get("Content-Length")
+                if response.status == 200 and content_length and int(content_length) == existing.stat().st_size:
+                    return existing.name
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Can't confirm the saved copy; download it again below
+            pass
     
     # Download image
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, ssl=False) as response:
-            if response.status == 200:
-                content = await response.read()
-                with open(filepath, "wb") as f:
-                    f.write(content)
-                return filename
-            else:
-                raise Exception(f"HTTP {response.status}")
+    async with session.get(url) as response:
+        if response.status == 200:
+            try:
+                header = await response.content.readexactly(IMAGE_SNIFF_BYTES)
+            except asyncio.IncompleteReadError as e:
+                header = e.partial
+            
+            filename = f"{stem}{_sniff_image_ext(header) or ext}"
+            filepath = images_dir / filename
+            
+            # Stream to disk, keeping the blocking file calls off the event loop
+            f = await asyncio.to_thread(open, filepath, "wb")
+            try:
+                await asyncio.to_thread(f.write, header)
+                async for chunk in response.content.iter_chunked(IMAGE_CHUNK_SIZE):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+            return filename
+        else:
+            raise Exception(f"HTTP {response.status}")
 
 
 if __name__ == "__main__":